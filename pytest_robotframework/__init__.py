@@ -15,6 +15,7 @@ from pathlib import Path
 from traceback import format_stack
 from types import TracebackType
 from typing import TYPE_CHECKING, Callable, TypeVar, Union, cast, overload
+from weakref import WeakKeyDictionary
 
 from basedtyping import FunctionType as Function, P, T
 from pytest import StashKey
@@ -36,6 +37,13 @@ from typing_extensions import Literal, Never, TypeAlias, deprecated, override
 
 from pytest_robotframework._internal.cringe_globals import current_item, current_session
 from pytest_robotframework._internal.errors import InternalError
+from pytest_robotframework._internal.pytest.duration_history import (
+    DurationStats as _DurationStats,
+    duration_history,
+)
+from pytest_robotframework._internal.robot.ansi import (
+    DeferredAnsiConverter as _DeferredAnsiConverter,
+)
 from pytest_robotframework._internal.robot.utils import (
     Listener as _Listener,
     RobotOptions as _RobotOptions,
@@ -45,11 +53,14 @@ from pytest_robotframework._internal.robot.utils import (
     get_arg_with_type,
     is_robot_traceback,
     robot_6,
+    truncated_str,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Mapping
 
+    from pytest import Config
+
     from pytest_robotframework._internal.utils import SuppressableContextManager
 
 RobotVariables: TypeAlias = dict[str, object]
@@ -83,6 +94,9 @@ def import_resource(path: Path | str) -> None:
         _resources.append(Path(path))
 
 
+_robot_model_path = Path(model.__file__)
+
+
 class _FullStackStatusReporter(StatusReporter):
     """Riced status reporter that does the following:
 
@@ -109,21 +123,22 @@ class _FullStackStatusReporter(StatusReporter):
             return ExecutionFailed(msg, syntax=exc_value.syntax)
 
         tb = None
-        full_system_traceback = inspect.stack()
         in_framework = True
         base_tb = exc_value.__traceback__
         while base_tb and is_robot_traceback(base_tb):
             base_tb = base_tb.tb_next
-        for frame in full_system_traceback:
-            trace = TracebackType(
-                tb or base_tb, frame.frame, frame.frame.f_lasti, frame.frame.f_lineno
-            )
+        # walking the frames directly instead of using `inspect.stack` because it reads the source
+        # code for every frame, which is slow and we don't need it
+        frame = inspect.currentframe()
+        while frame:
+            trace = TracebackType(tb or base_tb, frame, frame.f_lasti, frame.f_lineno)
+            frame = frame.f_back
             if in_framework and is_robot_traceback(trace):
                 continue
             in_framework = False
             tb = trace
             # find a frame from a module that should always be in the trace
-            if Path(frame.filename) == Path(model.__file__):
+            if Path(trace.tb_frame.f_code.co_filename) == _robot_model_path:
                 break
         else:
             # using logger.error because raising an exception here would screw up the output xml
@@ -233,26 +248,39 @@ class _KeywordDecorator:
             name=keyword_name, tags=self._tags
         )(fn)
 
+        module = self._module or fn.__module__
+        doc: str = (getshortdoc(inspect.getdoc(fn)) or "") if self._doc is None else self._doc
+        runners = WeakKeyDictionary[_ExecutionContext, LibraryKeywordRunner]()
+        """the runner for the keyword in each execution context, since looking it up searches every
+        library and resource in robot's namespace (and usually fails, since most python keywords
+        aren't in it, which is even slower because robot looks for similarly named keywords to
+        recommend)"""
+
+        def get_runner(context: _ExecutionContext) -> LibraryKeywordRunner:
+            runner = runners.get(context)
+            if runner is None:
+                runner = cast(
+                    LibraryKeywordRunner,
+                    context.get_runner(keyword_name),  # pyright:ignore[reportUnknownMemberType]
+                )
+                runners[context] = runner
+            return runner
+
+        def truncate(arg: object) -> str:
+            """robotframework usually just uses the argument as it was written in the source
+            code, but since we can't easily access that in python, we use the actual value
+            instead, but that can sometimes be huge so we truncate it. you can see the full
+            value when running with the DEBUG loglevel anyway"""
+            return truncated_str(arg, max_length=50)
+
         @wraps(fn)
         def inner(*args: P.args, **kwargs: P.kwargs) -> T:
-            def truncate(arg: object) -> str:
-                """robotframework usually just uses the argument as it was written in the source
-                code, but since we can't easily access that in python, we use the actual value
-                instead, but that can sometimes be huge so we truncate it. you can see the full
-                value when running with the DEBUG loglevel anyway"""
-                max_length = 50
-                value = str(arg)
-                return value[:max_length] + "..." if len(value) > max_length else value
-
-            if self._module is None:
-                self._module = fn.__module__
             log_args = (
                 *(truncate(arg) for arg in args),
                 *(f"{key}={truncate(value)}" for key, value in kwargs.items()),
             )
             context = execution_context()
             data = running.Keyword(name=keyword_name, args=log_args)
-            doc: str = (getshortdoc(inspect.getdoc(fn)) or "") if self._doc is None else self._doc
             # we suppress the error in the status reporter because we raise it ourselves
             # afterwards, so that context managers like `pytest.raises` can see the actual
             # exception instead of `robot.errors.HandlerExecutionFailed`
@@ -269,7 +297,7 @@ class _KeywordDecorator:
                             result.Keyword(
                                 # pyright is only run when robot 7 is installed
                                 kwname=keyword_name,  # pyright:ignore[reportCallIssue]
-                                libname=self._module,  # pyright:ignore[reportCallIssue]
+                                libname=module,  # pyright:ignore[reportCallIssue]
                                 doc=doc,
                                 args=log_args,
                                 tags=self._tags,
@@ -284,19 +312,14 @@ class _KeywordDecorator:
                             data=data,
                             result=result.Keyword(
                                 name=keyword_name,
-                                owner=self._module,
+                                owner=module,
                                 doc=doc,
                                 args=log_args,
                                 tags=self._tags,
                             ),
                             context=context,
                             suppress=suppress,
-                            implementation=cast(
-                                LibraryKeywordRunner,
-                                context.get_runner(  # pyright:ignore[reportUnknownMemberType]
-                                    keyword_name
-                                ),
-                            ).keyword.bind(data),
+                            implementation=get_runner(context).keyword.bind(data),
                         )
                     )
                 )
@@ -576,6 +599,28 @@ _T_ListenerOrSuiteVisitor = TypeVar(
 )
 
 
+def _catch_errors_in(fn: Callable[P, T], owner_name: str) -> Callable[P, T]:
+    """wraps a single listener or suite visitor method for `catch_errors`"""
+
+    @wraps(fn)
+    def inner(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            item_or_session = current_item() or current_session()
+            if not item_or_session:
+                raise InternalError(
+                    # stack trace isn't showsn so we neewd to include the original error in the
+                    # message as well
+                    f"an error occurred inside {owner_name} and failed to get the"
+                    + f" current pytest item/session: {e}"
+                ) from e
+            add_robot_error(item_or_session, str(e))
+            raise
+
+    return inner
+
+
 def catch_errors(cls: _T_ListenerOrSuiteVisitor) -> _T_ListenerOrSuiteVisitor:
     """errors that occur inside suite visitors and listeners do not cause the test run to fail. even
     `--exitonerror` doesn't catch every exception (see <https://github.com/robotframework/robotframework/issues/4853>).
@@ -590,25 +635,6 @@ def catch_errors(cls: _T_ListenerOrSuiteVisitor) -> _T_ListenerOrSuiteVisitor:
     if hasattr(cls, marker):
         return cls
 
-    def wrapped(fn: Callable[P, T]) -> Callable[P, T]:
-        @wraps(fn)
-        def inner(*args: P.args, **kwargs: P.kwargs) -> T:
-            try:
-                return fn(*args, **kwargs)
-            except Exception as e:
-                item_or_session = current_item() or current_session()
-                if not item_or_session:
-                    raise InternalError(
-                        # stack trace isn't showsn so we neewd to include the original error in the
-                        # message as well
-                        f"an error occurred inside {cls.__name__} and failed to get the"
-                        + f" current pytest item/session: {e}"
-                    ) from e
-                add_robot_error(item_or_session, str(e))
-                raise
-
-        return inner
-
     for name, method in cast(
         list[tuple[str, Function]],
         inspect.getmembers(
@@ -626,7 +652,7 @@ def catch_errors(cls: _T_ListenerOrSuiteVisitor) -> _T_ListenerOrSuiteVisitor:
             and not attr.__name__.startswith("_"),
         ),
     ):
-        setattr(cls, name, wrapped(method))
+        setattr(cls, name, _catch_errors_in(method, cls.__name__))
     setattr(cls, marker, True)
     return cls
 
@@ -733,8 +759,35 @@ def hide_asserts_from_robot_log() -> Iterator[None]:
         item.stash[_hide_asserts_context_manager_key] = previous_value
 
 
+def get_test_durations(config: Config) -> dict[str, DurationStats]:
+    """gets how long each test took in the previous runs, which is useful for things like ordering
+    or sharding the tests. the durations are taken from the test reports at the end of each run and
+    stored in pytest's cache directory, so this returns an empty `dict` if the `cacheprovider`
+    plugin is disabled.
+
+    :return: the durations keyed by the pytest nodeid of each test
+
+    example:
+    -------
+    .. code-block:: python
+
+        def pytest_collection_modifyitems(config: Config, items: list[Item]):
+            durations = get_test_durations(config)
+            # run the slowest tests first
+            items.sort(
+                key=lambda item: durations.get(item.nodeid, {"average": 0})["average"], reverse=True
+            )
+    """
+    history = duration_history(config)
+    return {} if history is None else history.stats()
+
+
 # ideally these would just use an explicit re-export
 # https://github.com/mitmproxy/pdoc/issues/667
 Listener: TypeAlias = _Listener
 
 RobotOptions: TypeAlias = _RobotOptions
+
+DurationStats: TypeAlias = _DurationStats
+
+DeferredAnsiConverter: TypeAlias = _DeferredAnsiConverter
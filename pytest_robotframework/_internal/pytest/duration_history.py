@@ -0,0 +1,115 @@
+"""keeps a history of how long each test took in pytest's cache directory, so that the durations
+are still available when the robot output from the previous run has been deleted or overwritten"""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from typing import TYPE_CHECKING, Optional, TypedDict, cast
+
+from pytest import Cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from pytest import Config
+
+
+class DurationStats(TypedDict):
+    """how long a test took in the previous runs, in seconds"""
+
+    runs: int
+    """the number of runs the test has durations for"""
+    average: float
+    """a moving average of the durations, which favors the most recent runs"""
+    last: float
+    """the duration from the most recent run"""
+
+
+_CachedFile = dict[str, tuple[int, float, float]]
+"""the stats for each test in a file, stored as lists instead of dicts to keep the cache small"""
+
+_smoothing = 0.3
+"""how much the most recent duration affects the average"""
+
+
+def _file_of(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
+
+
+class DurationHistory:
+    """the durations of the tests from previous runs, keyed by the pytest nodeid of each test.
+
+    the durations are stored in a separate cache entry for each file, so that updating them only
+    rewrites the entries for the files whose tests ran instead of the whole history"""
+
+    _cache_key = "pytest_robotframework/durations"
+
+    def __init__(self, cache: Cache):
+        super().__init__()
+        self._pytest_cache = cache
+        self._files = cast(list[str], cache.get(f"{self._cache_key}/files", []))
+        """the files that have durations stored for them"""
+
+    def _file_key(self, file: str) -> str:
+        return f"{self._cache_key}/{sha256(file.encode()).hexdigest()[:16]}"
+
+    def _load_file(self, file: str) -> _CachedFile:
+        return cast(Optional[_CachedFile], self._pytest_cache.get(self._file_key(file), None)) or {}
+
+    def stats(self) -> dict[str, DurationStats]:
+        return {
+            nodeid: {"runs": runs, "average": average, "last": last}
+            for file in self._files
+            for nodeid, (runs, average, last) in self._load_file(file).items()
+        }
+
+    def averages(self) -> dict[str, float]:
+        return {nodeid: stats["average"] for nodeid, stats in self.stats().items()}
+
+    def update(self, durations: Mapping[str, float]):
+        """adds the durations from a run to the history and saves it"""
+        durations_by_file: dict[str, list[tuple[str, float]]] = {}
+        for nodeid, duration in durations.items():
+            durations_by_file.setdefault(_file_of(nodeid), []).append((nodeid, duration))
+        for file, file_durations in durations_by_file.items():
+            cached_file = self._load_file(file)
+            for nodeid, duration in file_durations:
+                previous = cached_file.get(nodeid)
+                if previous is None:
+                    cached_file[nodeid] = (1, duration, duration)
+                else:
+                    runs, average, _ = previous
+                    cached_file[nodeid] = (
+                        runs + 1,
+                        average + (duration - average) * _smoothing,
+                        duration,
+                    )
+            self._pytest_cache.set(self._file_key(file), cached_file)
+        new_files = durations_by_file.keys() - set(self._files)
+        if new_files:
+            self._files.extend(sorted(new_files))
+            self._pytest_cache.set(f"{self._cache_key}/files", self._files)
+
+
+def duration_history(config: Config) -> DurationHistory | None:
+    """the durations of the tests from the previous runs. `None` if the cacheprovider plugin is
+    disabled"""
+    cache = cast(Optional[Cache], getattr(config, "cache", None))
+    return None if cache is None else DurationHistory(cache)
+
+
+def duration_estimator(durations: Mapping[str, float]) -> Callable[[Iterable[str]], float]:
+    """for working out how long a group of tests (eg. a suite) will take from the durations of the
+    previous runs, so that the slowest ones can be scheduled first.
+
+    tests that didn't run last time are assumed to take the average amount of time, or if there's
+    nothing to go off, the number of tests is used instead
+
+    :return: a function that gets the total duration of the tests with the specified nodeids
+    """
+    default_duration = sum(durations.values()) / len(durations) if durations else 1
+
+    def estimate(nodeids: Iterable[str]) -> float:
+        return sum(durations.get(nodeid, default_duration) for nodeid in nodeids)
+
+    return estimate
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import contextlib
+import glob
 import os
+import sys
+from argparse import SUPPRESS
 from ast import Assert, Call, Constant, Expr, If, Raise, copy_location, stmt
+from operator import itemgetter
 from pathlib import Path
-from typing import IO
+from subprocess import Popen  # noqa: S404
+from typing import IO, Optional
 
 import pytest
 from _pytest.assertion import rewrite
@@ -17,8 +22,10 @@ from _pytest.assertion.rewrite import (
 )
 from _pytest.main import resolve_collection_argument
 from pytest import (
+    Cache,
     Collector,
     Config,
+    ExitCode,
     StashKey,
     TempPathFactory,
     TestReport,
@@ -33,7 +40,10 @@ from robot.conf.settings import (
 )
 from robot.libraries.BuiltIn import BuiltIn
 from robot.output import LOGGER
+from robot.parsing.suitestructure import IncludedFiles, ValidExtensions
 from robot.rebot import Rebot
+from robot.result import Result
+from robot.result.merger import Merger
 from robot.result.resultbuilder import ExecutionResult  # pyright:ignore[reportUnknownVariableType]
 from robot.run import RobotFramework, RobotSettings
 from robot.utils.error import ErrorDetails
@@ -41,7 +51,6 @@ from typing_extensions import TYPE_CHECKING, Callable, Generator, Mapping, cast
 
 from pytest_robotframework import (
     AssertOptions,
-    Listener,
     RobotOptions,
     _hide_asserts_context_manager_key,  # pyright:ignore[reportPrivateUsage]
     _resources,  # pyright:ignore[reportPrivateUsage]
@@ -52,25 +61,62 @@ from pytest_robotframework import (
     keywordify,
 )
 from pytest_robotframework._internal import cringe_globals
-from pytest_robotframework._internal.cringe_globals import current_item
+from pytest_robotframework._internal.cringe_globals import current_item, current_session
 from pytest_robotframework._internal.errors import InternalError
+from pytest_robotframework._internal.pytest.duration_history import (
+    duration_estimator,
+    duration_history,
+)
 from pytest_robotframework._internal.pytest.exception_getter import exception_key
-from pytest_robotframework._internal.pytest.robot_file_support import RobotFile, RobotItem
+from pytest_robotframework._internal.pytest.result_cache import (
+    RobotResultCache,
+    project_module_files,
+)
+from pytest_robotframework._internal.pytest.robot_collection_cache import (
+    RobotCollectionCache,
+    is_init_file,
+)
+from pytest_robotframework._internal.pytest.robot_file_support import (
+    ParsedRobotSuites,
+    RobotFile,
+    RobotItem,
+    collected_robot_tests_key,
+    parsed_robot_suites_key,
+)
+from pytest_robotframework._internal.pytest.robot_processes import (
+    RobotProcess,
+    RobotProcessWorker,
+    output_file_name as robot_process_output_file_name,
+    partition_items,
+    run_robot_processes,
+)
 from pytest_robotframework._internal.pytest.xdist_utils import (
     is_xdist,
     is_xdist_master,
     is_xdist_worker,
     worker_id,
 )
+from pytest_robotframework._internal.robot.ansi import deferred_ansi_converter_name
+from pytest_robotframework._internal.robot.background_rebot import (
+    background_rebot_errors_file,
+    start_background_rebot,
+)
+from pytest_robotframework._internal.robot.durations import (
+    durations_from_output,
+    failures_from_output,
+)
 from pytest_robotframework._internal.robot.listeners_and_suite_visitors import (
     AnsiLogger,
     ErrorDetector,
+    ListenerDispatcher,
     PytestRuntestProtocolHooks,
     PytestRuntestProtocolInjector,
     PythonParser,
     RobotSuiteCollector,
     RobotTestFilterer,
+    RobotTestOrderer,
 )
+from pytest_robotframework._internal.robot.streaming_merge import StreamingOutputMerger
 from pytest_robotframework._internal.robot.utils import (
     InternalRobotOptions,
     banned_options,
@@ -84,11 +130,18 @@ from pytest_robotframework._internal.robot.utils import (
 from pytest_robotframework._internal.utils import patch_method
 
 if TYPE_CHECKING:
-    from types import TracebackType
+    from collections.abc import Iterator, Sequence
+    from types import ModuleType, TracebackType
 
     from _pytest.terminal import TerminalReporter
     from pluggy import PluginManager
-    from pytest import CallInfo, Item, Parser, Session
+    from pytest import CallInfo, CollectReport, Item, Parser, Session
+    from robot.api.interfaces import ListenerV3
+    from robot.model import SuiteVisitor
+    from robot.result import TestCase, TestSuite
+    from xdist.remote import Producer
+    from xdist.scheduler import LoadFileScheduling
+    from xdist.workermanage import WorkerController
 
 
 _explanation_key = StashKey[str]()
@@ -150,35 +203,35 @@ def visit_Assert(  # noqa: N802
     raise_statement = cast(Raise, main_test.body.pop())
     if not raise_statement.exc:
         raise InternalError("raise statement without exception")
-    main_test.body.append(
-        Expr(
-            self.helper(
-                "_call_assertion_hook",
-                Constant(expression),  # expression
-                assert_msg,  # fail_message
-                Constant(assert_.lineno),  # line_number
-                raise_statement.exc,  # assertion_error
-                cast(Call, raise_statement.exc).args[0],  # explanation
-            )
+    fail_statement = Expr(
+        self.helper(
+            "_call_assertion_hook",
+            Constant(expression),  # expression
+            assert_msg,  # fail_message
+            Constant(assert_.lineno),  # line_number
+            raise_statement.exc,  # assertion_error
+            cast(Call, raise_statement.exc).args[0],  # explanation
         )
     )
+    main_test.body.append(fail_statement)
 
     # rice the pass statements:
-    main_test.orelse.append(
-        Expr(
-            self.helper(
-                "_call_assertion_hook",
-                Constant(expression),  # expression
-                assert_msg,  # fail_message
-                Constant(assert_.lineno),  # line_number
-                Constant(None),  # assertion_error
-                # explanation is handled by the pytest_assertion_pass hook above, since its too
-                # hard to get it from here
-            )
+    pass_statement = Expr(
+        self.helper(
+            "_call_assertion_hook",
+            Constant(expression),  # expression
+            assert_msg,  # fail_message
+            Constant(assert_.lineno),  # line_number
+            Constant(None),  # assertion_error
+            # explanation is handled by the pytest_assertion_pass hook above, since its too
+            # hard to get it from here
         )
     )
-    # copied from the end of og, need to rerun this since a new statement was added:
-    for statement in result:
+    main_test.orelse.append(pass_statement)
+    # copied from the end of og, need to rerun this on the new statements. og already did it for the
+    # rest of them, and doing it again for the whole assertion is slow since the rewritten one is
+    # much bigger than the original
+    for statement in (fail_statement, pass_statement):
         for node in traverse_node(statement):
             _ = copy_location(node, assert_)
     return result
@@ -204,10 +257,11 @@ def _get_pytest_collection_paths(session: Session) -> frozenset[Path]:
     but there's a "circular dependency" between pytest collection and robot "collection":
     pytest collection needs the tests collected by robot, but for robot to run it needs the paths
     resolved during pytest collection."""
-    if session._initialpaths:  # pyright:ignore[reportPrivateUsage]
+    robot_process_worker = session.stash.get(_robot_process_worker_key, None)
+    if session._initialpaths and not robot_process_worker:  # pyright:ignore[reportPrivateUsage]
         return session._initialpaths  # pyright:ignore[reportPrivateUsage]
     result: set[Path] = set()
-    for arg in session.config.args:
+    for arg in robot_process_worker.args if robot_process_worker else session.config.args:
         collection_argument = resolve_collection_argument(
             session.config.invocation_params.dir,
             arg,
@@ -307,11 +361,104 @@ def _run_robot(session: Session, robot_options: InternalRobotOptions):
         )
 
 
+def _is_robot_file(path: Path) -> bool:
+    # pytest only creates items for `.robot` files, even if robot is configured to parse others
+    return path.suffix == ".robot"
+
+
+def _robot_files(session: Session) -> Iterator[Path]:
+    # cheaply finds the `.robot` files that robot's collection pass would parse in the collection
+    # paths (along with any `__init__` files), without parsing anything. this follows the same rules
+    # robot uses to decide which files to parse (`extension`, `parseinclude` and ignoring files and
+    # directories starting with `_` or `.`), but if in doubt it includes the file
+    robot_args = _get_robot_args(session)
+    # the default value is a tuple of extensions but if the user specified it, it's a string
+    extension: str | Sequence[str] = robot_args.get("extension") or ["robot"]
+    parse_include = robot_args.get("parseinclude", [])
+    valid_extensions = ValidExtensions(
+        extension.split(":") if isinstance(extension, str) else extension, parse_include
+    )
+    included_files = IncludedFiles(parse_include)
+
+    def is_included(path: Path) -> bool:
+        return _is_robot_file(path) and valid_extensions.match(path) and included_files.match(path)
+
+    for collection_path in _get_pytest_collection_paths(session):
+        if collection_path.is_file():
+            if is_included(collection_path):
+                yield collection_path
+            continue
+        for directory, directory_names, file_names in os.walk(collection_path, followlinks=True):
+            directory_names[:] = [
+                name
+                for name in directory_names
+                if not name.startswith(("_", ".")) and name != "CVS"
+            ]
+            for file_name in file_names:
+                path = Path(directory, file_name)
+                if (is_init_file(path) and valid_extensions.match(path)) or (
+                    not file_name.startswith(("_", ".")) and is_included(path)
+                ):
+                    yield path
+
+
 def _robot_collect(session: Session):
+    """sets `session.stash[collected_robot_tests_key]` which is then used in
+    `_internal.pytest.robot_file_support` during collection to create `RobotItem`s for tests located
+    in `.robot` files.
+
+    the tests are cached in pytest's cache directory, so robot only needs to parse the files that
+    changed since the last run
+    """
+    session.stash[collected_robot_tests_key] = {}
+    if not session.config.option.robot_files:  # pyright:ignore[reportAny]
+        return
+    robot_files = _robot_files(session)
+    # the cache doesn't exist when the cacheprovider plugin is disabled
+    cache = cast(Optional[Cache], getattr(session.config, "cache", None))
+    if cache is None:
+        # starting robot just to find out that there's nothing to collect is pretty slow, which
+        # adds up for projects that only have python tests
+        if any(not is_init_file(path) for path in robot_files):
+            _robot_collect_files(session)
+        return
+    files = list(robot_files)
+    if all(is_init_file(path) for path in files):
+        return
+    robot_args = _get_robot_args(session)
+    collection_cache = RobotCollectionCache(
+        cache,
+        robot_args=robot_args,
+        collection_paths=_get_pytest_collection_paths(session),
+        files=files,
+    )
+    # if the user specified their own parseinclude we can't use it to only parse the stale files.
+    # their prerunmodifiers and parsers can also change which tests get collected without any of the
+    # files changing, so the cached tests can't be used with them either
+    if collection_cache.needs_full_collection or any(
+        robot_args.get(option) for option in ("parseinclude", "prerunmodifier", "parser")
+    ):
+        stale_files = files
+    else:
+        stale_files = collection_cache.stale_files
+    if stale_files:
+        _robot_collect_files(session, None if stale_files is files else stale_files)
+        collection_cache.update(
+            (test for tests in session.stash[collected_robot_tests_key].values() for test in tests),
+            files=stale_files,
+        )
+    session.stash[collected_robot_tests_key] = {
+        **collection_cache.tests(exclude=stale_files),
+        **session.stash[collected_robot_tests_key],
+    }
+    collection_cache.save()
+
+
+def _robot_collect_files(session: Session, files: list[Path] | None = None):
     """runs robot in "collection" mode, meaning it won't actually run any tests or output any result
-    files. this is only used to set `session.stash[collected_robot_tests_key]` which is then used in
-    `_internal.pytest.robot_file_support` during collectionto create `RobotItem`s for tests located
-    in `.robot` files
+    files.
+
+    :param files: if provided, robot only parses these files (and any `__init__` files)
     """
     robot_options = {
         "report": None,
@@ -322,7 +469,19 @@ def _robot_collect(session: Session):
         "listener": None,
         "console": "none",
     }
-    _run_robot(session, robot_options)
+    if files is not None:
+        robot_options["parseinclude"] = [glob.escape(str(file)) for file in files]
+    parsed_suites: ParsedRobotSuites | None = None
+    # when running with xdist, robot runs separately for each test so there's nothing to reuse the
+    # suites in
+    if not is_xdist_worker(session):
+        parsed_suites = ParsedRobotSuites(copy=bool(_get_robot_args(session).get("prerunmodifier")))
+        session.stash[parsed_robot_suites_key] = parsed_suites
+    try:
+        _run_robot(session, robot_options)
+    finally:
+        if parsed_suites:
+            parsed_suites.saving = False
 
 
 def _robot_run_tests(session: Session, xdist_item: Item | None = None):
@@ -333,7 +492,11 @@ def _robot_run_tests(session: Session, xdist_item: Item | None = None):
     """
     items = [xdist_item] if xdist_item else session.items
     robot_options: InternalRobotOptions = {"parser": [PythonParser(items)], "extension": "py:robot"}
-    listeners: list[Listener] = [ErrorDetector(session=session, item=xdist_item), AnsiLogger()]
+    defer_ansi_conversion = cast(bool, session.config.option.defer_ansi_conversion)
+    listeners: list[ListenerV3] = [
+        ErrorDetector(session=session, item=xdist_item),
+        AnsiLogger(defer_conversion=defer_ansi_conversion),
+    ]
     if not robot_6:
         # this listener is conditionally defined so has to be conditionally imported
         from pytest_robotframework._internal.robot.listeners_and_suite_visitors import (  # noqa: PLC0415
@@ -341,29 +504,36 @@ def _robot_run_tests(session: Session, xdist_item: Item | None = None):
         )
 
         listeners.append(KeywordUnwrapper())
+    prerunmodifiers: list[SuiteVisitor] = [
+        RobotTestFilterer(session, items=items),
+        PytestRuntestProtocolInjector(session=session, item=xdist_item),
+    ]
+    if not xdist_item and _should_order_items(session):
+        prerunmodifiers.append(RobotTestOrderer(session, items=items))
     robot_options = merge_robot_options(
         robot_options,
         {
-            "prerunmodifier": [
-                RobotTestFilterer(session, items=items),
-                PytestRuntestProtocolInjector(session=session, item=xdist_item),
-            ],
-            "listener": listeners,
+            "prerunmodifier": prerunmodifiers,
+            # the output gets written as the tests run, so this only affects the log and report
+            "prerebotmodifier": [deferred_ansi_converter_name] if defer_ansi_conversion else [],
         },
     )
+    background_log_output: Path | None = None
+    xdist_output: Path | None = None
     # if xdist_item is not set then it's being run from pytest_runtest_protocol instead of
     # pytest_runtestloop so we don't need to re-implement pytest_runtest_protocol
     if xdist_item:
+        xdist_output = (
+            _xdist_temp_dir(session)
+            / _xdist_ourput_dir_name
+            / f"{worker_id(session)}_{hash(xdist_item.nodeid)}.xml"
+        )
         robot_options = merge_robot_options(
             robot_options,
             {
                 "report": None,
                 "log": None,
-                "output": str(
-                    _xdist_temp_dir(xdist_item.session)
-                    / _xdist_ourput_dir_name
-                    / f"{worker_id(xdist_item.session)}_{hash(xdist_item.nodeid)}.xml"
-                ),
+                "output": str(xdist_output),
                 # we don't want prerebotmodifiers to run multiple times so we defer them to the end
                 # of the test if we're running with xdist
                 "prerebotmodifier": None,
@@ -371,7 +541,49 @@ def _robot_run_tests(session: Session, xdist_item: Item | None = None):
         )
     else:
         listeners.append(PytestRuntestProtocolHooks(session=session))
-    _ = _run_robot(session, robot_options)
+        robot_process_worker = session.stash.get(_robot_process_worker_key, None)
+        if robot_process_worker:
+            # the controller merges the outputs and generates the log, like with xdist
+            robot_options = merge_robot_options(
+                robot_options,
+                {
+                    "report": None,
+                    "log": None,
+                    "output": str(robot_process_worker.output),
+                    "prerebotmodifier": None,
+                },
+            )
+        elif _unchanged_tests_key in session.stash:
+            # the results of the unchanged tests get merged into the output afterwards, which
+            # generates the log
+            robot_options = merge_robot_options(
+                robot_options,
+                {
+                    "report": None,
+                    "log": None,
+                    "output": str(_result_cache_dir(session) / "output.xml"),
+                    "prerebotmodifier": None,
+                },
+            )
+        else:
+            background_log_output = _background_robot_log_output(
+                session, RobotSettings(_get_robot_args(session))
+            )
+        if background_log_output:
+            robot_options = merge_robot_options(robot_options, {"log": None, "report": None})
+    robot_options = merge_robot_options(
+        robot_options, {"listener": [ListenerDispatcher(listeners)]}
+    )
+    try:
+        _ = _run_robot(session, robot_options)
+    finally:
+        # the suites parsed during collection can only be reused by the first run
+        if parsed_robot_suites_key in session.stash:
+            del session.stash[parsed_robot_suites_key]
+    if xdist_item and xdist_output:
+        _add_xdist_item_output(session, xdist_output)
+    elif background_log_output:
+        _generate_robot_log(session, background_log_output, _rebot_options(session))
 
 
 def pytest_addhooks(pluginmanager: PluginManager):
@@ -394,6 +606,78 @@ def pytest_addoption(parser: Parser):
         + " `pytest_robotframework.AssertionOptions` class with `log_pass=True`. see the docs for"
         + " more information: https://github.com/DetachHead/pytest-robotframework/tree/assertion-ricing#hiding-non-user-facing-assertions",
     )
+    group.addoption(
+        "--no-robot-files",
+        dest="robot_files",
+        default=True,
+        action="store_false",
+        help="don't collect tests from `.robot` files. robot's collection pass is skipped entirely,"
+        + " which speeds up startup for projects that only contain python tests. note that this"
+        + " pass is already skipped automatically when there are no `.robot` files to collect",
+    )
+    group.addoption(
+        "--xdist-streaming-merge",
+        default=False,
+        action="store_true",
+        help="when running with xdist, merge the output files from the workers one suite at a time"
+        + " instead of loading all of them into memory at once, so that the memory usage is bounded"
+        + " by the largest suite rather than the whole run. this only applies to the output file,"
+        + " generating the log and report still loads the whole merged output, so the memory usage"
+        + " is only bounded with --robot-log NONE --robot-report NONE. it also isn't used if any"
+        + " rebot options that modify the results are specified",
+    )
+    group.addoption(
+        "--xdist-robot-suite-scheduling",
+        default=False,
+        action="store_true",
+        help="when running with xdist, schedule all the tests from each file (ie. each robot suite)"
+        + " on the same worker, so that suite setups and teardowns aren't repeated on every worker."
+        + " the suites that took the longest in the previous run's output file get scheduled first",
+    )
+    group.addoption(
+        "--robot-failed-first",
+        default=False,
+        action="store_true",
+        help="run the tests that failed in the previous run's output file first, followed by the"
+        + " tests in files that were modified since then. robot also runs the tests in the same"
+        + " order as pytest when this is used",
+    )
+    group.addoption(
+        "--robot-result-cache",
+        default=False,
+        action="store_true",
+        help="skip the tests that passed in the previous run if none of the files they depend on"
+        + " have changed. their results from the previous run are put in the output instead",
+    )
+    group.addoption(
+        "--robot-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="run the tests in parallel in N separate pytest processes without xdist. the tests are"
+        + " split up by file (ie. by robot suite), and robot only runs once in each process",
+    )
+    group.addoption(
+        "--robot-process-dir",
+        default=None,
+        # only used internally to start the processes for --robot-processes
+        help=SUPPRESS,
+    )
+    group.addoption(
+        "--background-robot-log",
+        default=False,
+        action="store_true",
+        help="only write robot's output file while the tests are running, then generate the log and"
+        + " report from it in a separate process in the background, so that pytest can exit"
+        + " without waiting for them to be generated",
+    )
+    group.addoption(
+        "--defer-ansi-conversion",
+        default=False,
+        action="store_true",
+        help="instead of converting the ansi escape codes in log messages to html while the tests"
+        + " are running, leave them in the output file and convert them when the log is generated",
+    )
     for arg_name, default_value in cli_defaults(RobotSettings).items():
         if arg_name in banned_options:
             continue
@@ -422,93 +706,328 @@ def pytest_addoption(parser: Parser):
             )
 
 
+_merged_suite_names_key = StashKey[list[str]]()
+"""the names of the top level suites in each of the outputs being merged after running with xdist"""
+
+_combined_suite_names_key = StashKey[dict[str, list[str]]]()
+"""the names of the top level suites that each combined suite name was made from, so that outputs
+that were already merged (eg. on an xdist worker) can be merged again using the original names"""
+
+_combined_suite_names_worker_output_key = "pytest_robotframework_combined_suite_names"
+"""the key in xdist's `workeroutput` that the combined suite names from each worker get sent to the
+controller in"""
+
+
+@patch_method(Merger)
+def merge(  # pyright:ignore[reportUnusedFunction]
+    og: Callable[[Merger, Result], None], self: Merger, merged: Result
+):
+    """if tests from different suites were run, the top level suite in each output can have a
+    different name. rebot will refuse to merge if the top level suite names don't match, so we give
+    them all the same name as they get merged"""
+    session = current_session()
+    suite_names = session.stash.get(_merged_suite_names_key, None) if session else None
+    if session and suite_names is not None:
+        combined_suite_names = session.stash.setdefault(_combined_suite_names_key, {})
+        for suite in (self.result.suite, merged.suite):
+            for suite_name in combined_suite_names.get(suite.name, [suite.name]):
+                if suite_name not in suite_names:
+                    suite_names.append(suite_name)
+        combined_suite_name = " & ".join(suite_names)
+        combined_suite_names[combined_suite_name] = list(suite_names)
+        self.result.suite.name = merged.suite.name = combined_suite_name
+    og(self, merged)
+
+
+@patch_method(Merger)
+def _create_add_message(  # pyright:ignore[reportUnusedFunction]
+    og: Callable[[Merger, TestSuite | TestCase, bool], str],
+    self: Merger,
+    item: TestSuite | TestCase,
+    suite: bool = False,  # noqa: FBT001, FBT002
+) -> str:
+    """rebot adds a message to every suite and test that only exists in one of the outputs. that's
+    the case for every test when merging the outputs from xdist, which is an implementation detail
+    so it shouldn't show up in the log. this also prevents the message from getting added multiple
+    times since the outputs from each worker get merged twice"""
+    session = current_session()
+    if session and _merged_suite_names_key in session.stash:
+        return item.message
+    return og(self, item, suite)
+
+
 @hookimpl(tryfirst=True)
 def pytest_sessionstart(session: Session):
     _keywordify_pytest_functions()
     cringe_globals._current_session = session  # pyright:ignore[reportPrivateUsage]
+    robot_process_dir = cast(Optional[str], session.config.option.robot_process_dir)
+    if robot_process_dir:
+        robot_process_worker = RobotProcessWorker(
+            Path(robot_process_dir), list(session.config.args)
+        )
+        session.stash[_robot_process_worker_key] = robot_process_worker
+        # only collect the items that the controller wants this process to run
+        session.config.args[:] = robot_process_worker.collection_args(session.config.rootpath)
+    elif session.config.option.robot_processes and is_xdist(session):  # pyright:ignore[reportAny]
+        raise pytest.UsageError("--robot-processes can't be used with xdist")
+    if session.config.option.robot_result_cache and is_xdist(session):  # pyright:ignore[reportAny]
+        raise pytest.UsageError("--robot-result-cache can't be used with xdist")
+
+
+@contextlib.contextmanager
+def _merging_robot_outputs(session: Session) -> Iterator[None]:
+    """enables the patches on rebot's `Merger` while merging the outputs from xdist"""
+    session.stash[_merged_suite_names_key] = []
+    try:
+        yield
+    finally:
+        del session.stash[_merged_suite_names_key]
+
+
+def _merge_robot_outputs(session: Session, outputs: Sequence[Path], **rebot_options: object):
+    def redirector(file: IO[str]) -> contextlib._RedirectStream[IO[str]]:  # pyright: ignore[reportPrivateUsage]
+        # Here we create a jenkem huffer because you can't control rebots console output
+        #  Rebot uses __stdout__, which doesn't have an implementation in contextlib
+        result = contextlib._RedirectStream(file)  # pyright: ignore[reportPrivateUsage]
+        result._stream = "__stdout__"  # pyright: ignore[reportAttributeAccessIssue]
+        return result
+
+    # parenthesized context managers aren't supported in python 3.9
+    with Path(os.devnull).open("w", encoding="UTF8") as devull, redirector(devull):  # noqa: SIM117
+        with _merging_robot_outputs(session):
+            _ = Rebot().main(  # pyright:ignore[reportUnknownVariableType,reportUnknownMemberType]
+                outputs,
+                # merge is deliberately specified here instead of in rebot_options because it
+                # should never be overwritten
+                merge=True,
+                **rebot_options,
+            )
+
+
+def _rebot_options(session: Session) -> dict[str, object]:
+    """the options for running rebot on the output from this session, based on the robot args"""
+    robot_args = _get_robot_args(session=session)
+
+    def option_names(settings: Mapping[str, tuple[str, object]]) -> list[str]:
+        return [value[0] for value in settings.values()]
+
+    rebot_options = merge_robot_options(
+        {
+            # rebot doesn't recreate the output.xml unless you sepecify it explicitly. we want to do
+            # this because our usage of rebot is an implementation detail and we want the output to
+            # appear the same regardless of whether the user is running with xdist
+            "output": "output.xml"
+        },
+        {
+            # filter out any robot args that aren't valid rebot args
+            key: value
+            for key, value in robot_args.items()
+            if key
+            in option_names(
+                RebotSettings._extra_cli_opts  # pyright:ignore[reportPrivateUsage]
+            )
+            or key
+            in option_names(
+                _BaseSettings._cli_opts  # pyright:ignore[reportPrivateUsage,reportUnknownArgumentType,reportUnknownMemberType]
+            )
+        },
+    )
+
+    # we need to always set the loglevel to TRACE, despite whatever it was set to when running
+    # robot. otherwise if the loglevel was changed to DEBUG or TRACE programmatically inside a test,
+    # they would not appear in the merged output
+    log_level_value = robot_args["loglevel"]
+    default_log_level = log_level_value.split(":")[1] if ":" in log_level_value else "INFO"
+    rebot_options["loglevel"] = f"TRACE:{default_log_level}"
+    if session.config.option.defer_ansi_conversion:  # pyright:ignore[reportAny]
+        rebot_options = merge_robot_options(
+            rebot_options, {"prerebotmodifier": [deferred_ansi_converter_name]}
+        )
+    return rebot_options
+
+
+def _background_robot_log_output(session: Session, settings: _BaseSettings) -> Path | None:
+    """if `--background-robot-log` was specified, returns the output file that the log and report
+    should be generated from once it's been written. returns `None` if they should be generated
+    normally instead"""
+    if (
+        not session.config.option.background_robot_log  # pyright:ignore[reportAny]
+        or settings.output is None
+        or not (settings.log or settings.report)
+    ):
+        return None
+    return Path(settings.output)
+
+
+_background_rebot_key = StashKey[tuple[Popen[bytes], Path]]()
+"""the process generating the log and report in the background and the output it's generating
+them from, so that it can be reported in the terminal summary"""
+
+
+def _generate_robot_log(session: Session, output: Path, rebot_options: Mapping[str, object]):
+    """generates the log and report from an output that was written without them, in a separate
+    process if possible so that pytest doesn't have to wait for it"""
+    rebot_options = merge_robot_options(rebot_options, {"output": None, "xunit": None})
+    process = start_background_rebot(output, rebot_options)
+    if process:
+        session.config.stash[_background_rebot_key] = (process, output)
+    else:
+        _merge_robot_outputs(session, [output], **rebot_options)
+
+
+def _can_stream_robot_outputs(settings: RebotSettings) -> bool:
+    """the streaming merge only merges the outputs, so it can't be used if any of the rebot options
+    would modify the results"""
+    return (
+        settings.output is not None
+        and Path(settings.output).suffix != ".json"
+        and settings.suite_config == RebotSettings().suite_config
+        # the messages converted by this one only need to be converted in the log, which the
+        # streaming merge doesn't write
+        and not [
+            modifier
+            for modifier in settings.pre_rebot_modifiers
+            if modifier != deferred_ansi_converter_name
+        ]
+        and not settings.flatten_keywords
+    )
+
+
+def _stream_robot_outputs(
+    session: Session, outputs: Sequence[Path], settings: RebotSettings, **rebot_options: object
+):
+    """merges the outputs one suite at a time (see `--xdist-streaming-merge`), then generates the
+    log and report from the merged output"""
+    output = Path(cast(Path, settings.output))
+    merger = StreamingOutputMerger(
+        _xdist_temp_dir(session) / "robot_streaming_merge",
+        merging=lambda: _merging_robot_outputs(session),
+    )
+    for worker_output in outputs:
+        merger.add_output(worker_output)
+    merger.write(output, stat_config=settings.statistics_config)
+    if settings.log or settings.report or settings.xunit:
+        _merge_robot_outputs(
+            session, [output], **merge_robot_options(rebot_options, {"output": None})
+        )
+
+
+def _merge_parallel_robot_outputs(session: Session, outputs: Sequence[Path]):
+    """merges the outputs from running the tests in parallel (using xdist or `--robot-processes`)
+    and generates the log and report from them"""
+    rebot_options = _rebot_options(session)
+    background_log_output = _background_robot_log_output(session, RebotSettings(rebot_options))
+    merge_options = (
+        merge_robot_options(rebot_options, {"log": None, "report": None})
+        if background_log_output
+        else rebot_options
+    )
+    settings = RebotSettings(merge_options)
+    if session.config.option.xdist_streaming_merge and _can_stream_robot_outputs(settings):  # pyright:ignore[reportAny]
+        _stream_robot_outputs(session, outputs, settings, **merge_options)
+    else:
+        _merge_robot_outputs(session, outputs, **merge_options)
+    if background_log_output:
+        _generate_robot_log(session, background_log_output, rebot_options)
+
+
+_xdist_worker_result_key = StashKey[Result]()
+"""the results of all the tests that have run on this xdist worker so far"""
+
+
+def _add_xdist_item_output(session: Session, output: Path):
+    """merges the output from running robot on a single item into the results for the whole worker
+    and deletes it, so that there's only ever one output file per worker instead of one per test"""
+    if not output.exists():
+        return
+    result = cast(Result, ExecutionResult(output))
+    output.unlink()
+    worker_result = session.stash.get(_xdist_worker_result_key, None)
+    if worker_result is None:
+        session.stash[_xdist_worker_result_key] = result
+        return
+    with _merging_robot_outputs(session):
+        Merger(worker_result, rpa=worker_result.rpa).merge(result)
+
+
+def _save_xdist_worker_output(session: Session):
+    """saves the results from every test that ran on this worker, which the controller then merges
+    with the ones from the other workers. this means most of the merging happens in parallel since
+    each worker does it at the same time"""
+    worker_result = session.stash.get(_xdist_worker_result_key, None)
+    if worker_result is not None:
+        worker_result.save(
+            str(_xdist_temp_dir(session) / _xdist_ourput_dir_name / f"{worker_id(session)}.xml")
+        )
+    combined_suite_names = session.stash.get(_combined_suite_names_key, None)
+    if combined_suite_names:
+        workeroutput = cast(dict[str, object], session.config.workeroutput)  # pyright:ignore[reportAttributeAccessIssue]
+        workeroutput[_combined_suite_names_worker_output_key] = combined_suite_names
+
+
+@hookimpl(optionalhook=True)
+def pytest_testnodedown(node: WorkerController):
+    """gets the combined suite names from the worker, since its output needs to be merged with the
+    ones from the other workers using the original names"""
+    session = current_session()
+    # the worker output is missing if the worker crashed
+    workeroutput = cast(Optional[dict[str, object]], getattr(node, "workeroutput", None))
+    if session and workeroutput and _combined_suite_names_worker_output_key in workeroutput:
+        session.stash.setdefault(_combined_suite_names_key, {}).update(
+            cast(dict[str, list[str]], workeroutput[_combined_suite_names_worker_output_key])
+        )
 
 
 @hookimpl(wrapper=True, tryfirst=True)
 def pytest_sessionfinish(session: Session) -> HookWrapperResult:
     try:
-        if not session.config.option.collectonly and is_xdist_master(  # pyright:ignore[reportAny]
-            session
-        ):
-            robot_args = _get_robot_args(session=session)
-
-            def option_names(settings: Mapping[str, tuple[str, object]]) -> list[str]:
-                return [value[0] for value in settings.values()]
-
+        if session.config.option.collectonly:  # pyright:ignore[reportAny]
+            pass
+        elif is_xdist_worker(session):
+            _save_xdist_worker_output(session)
+        elif _robot_process_worker_key in session.stash:
+            session.stash[_robot_process_worker_key].close()
+        elif _robot_processes_key in session.stash:
+            _merge_parallel_robot_outputs(
+                session,
+                [
+                    *(
+                        output
+                        for process in session.stash[_robot_processes_key]
+                        if (output := process.directory / robot_process_output_file_name).exists()
+                    ),
+                    *_unchanged_test_outputs(session),
+                ],
+            )
+        elif _unchanged_tests_key in session.stash:
+            output = _result_cache_dir(session) / "output.xml"
+            _merge_parallel_robot_outputs(
+                session, [*([output] if output.exists() else []), *_unchanged_test_outputs(session)]
+            )
+        elif is_xdist_master(session):
             outputs = list(_xdist_temp_dir(session).glob(f"*/{_xdist_ourput_dir_name}/*.xml"))
             # if there were no outputs there were probably no tests run or some other error occured,
             # so silently skip this
             if outputs:
-
-                def redirector(file: IO[str]) -> contextlib._RedirectStream[IO[str]]:  # pyright: ignore[reportPrivateUsage]
-                    # Here we create a jenkem huffer because you can't control rebots console output
-                    #  Rebot uses __stdout__, which doesn't have an implementation in contextlib
-                    result = contextlib._RedirectStream(file)  # pyright: ignore[reportPrivateUsage]
-                    result._stream = "__stdout__"  # pyright: ignore[reportAttributeAccessIssue]
-                    return result
-
-                with Path(os.devnull).open("w", encoding="UTF8") as devull, redirector(devull):
-                    rebot = Rebot()
-                    # if tests from different suites were run, the top level suite can have a
-                    # different name. rebot will refuse to merge if the top level suite names
-                    # don't match, so we need to set them all to the same name before merging them.
-                    if len(outputs) > 1:
-                        merged_suite_name = cast(str, ExecutionResult(*outputs).suite.name)  # pyright:ignore[reportUnknownMemberType]
-                        for output in outputs:
-                            _ = cast(
-                                int,
-                                rebot.main(  # pyright:ignore[reportUnknownMemberType]
-                                    [output], output=output, name=merged_suite_name, stdout=None
-                                ),
-                            )
-                    rebot_options = merge_robot_options(
-                        {
-                            # rebot doesn't recreate the output.xml unless you sepecify it
-                            # explicitly. we want to do this because our usage of rebot is an
-                            # implementation detail and we want the output to appear the same
-                            # regardless of whether the user is running with xdist
-                            "output": "output.xml"
-                        },
-                        {
-                            # filter out any robot args that aren't valid rebot args
-                            key: value
-                            for key, value in robot_args.items()
-                            if key
-                            in option_names(
-                                RebotSettings._extra_cli_opts  # pyright:ignore[reportPrivateUsage]
-                            )
-                            or key
-                            in option_names(
-                                _BaseSettings._cli_opts  # pyright:ignore[reportPrivateUsage,reportUnknownArgumentType,reportUnknownMemberType]
-                            )
-                        },
-                    )
-
-                    # we need to always set the loglevel to TRACE, despite whatever it was set to
-                    # when running robot. otherwise if the loglevel was changed to DEBUG or TRACE
-                    # programmatically inside a test, they would not appear in the merged output
-                    log_level_value = robot_args["loglevel"]
-                    default_log_level = (
-                        log_level_value.split(":")[1] if ":" in log_level_value else "INFO"
-                    )
-                    rebot_options["loglevel"] = f"TRACE:{default_log_level}"
-
-                    _ = rebot.main(  # pyright:ignore[reportUnknownVariableType,reportUnknownMemberType]
-                        outputs,
-                        # merge is deliberately specified here instead of in the merged dict because
-                        # it should never be overwritten
-                        merge=True,
-                        **rebot_options,
-                    )
+                _merge_parallel_robot_outputs(session, outputs)
             else:
                 # this means robot was never run in any of the workers because there was no items,
                 # so we run it here to generate an empty log file to be consistent with what would
                 # happen when running with no items without xdist
                 _robot_run_tests(session)
+        if not (
+            session.config.option.collectonly  # pyright:ignore[reportAny]
+            or is_xdist_worker(session)
+            or _robot_process_worker_key in session.stash
+        ):
+            _update_duration_history(session)
+            _update_result_cache(session)
+        if session.exitstatus == ExitCode.NO_TESTS_COLLECTED and session.stash.get(
+            _unchanged_tests_key, None
+        ):
+            # every test was deselected because it passed last time, so their results are still in
+            # the output
+            session.exitstatus = ExitCode.OK
         yield
     finally:
         cringe_globals._current_session = None  # pyright:ignore[reportPrivateUsage]
@@ -565,8 +1084,35 @@ def pytest_collection(session: Session):
     _robot_collect(session)
 
 
+_imported_modules_key = StashKey[dict[Path, set[Path]]]()
+"""the modules in the project that each python test file imports, which `--robot-result-cache`
+fingerprints along with the test file"""
+
+
+@hookimpl(wrapper=True)
+def pytest_make_collect_report(
+    collector: Collector,
+) -> Generator[None, CollectReport, CollectReport]:
+    if not (
+        isinstance(collector, pytest.Module) and collector.config.option.robot_result_cache  # pyright:ignore[reportAny]
+    ):
+        return (yield)
+    # the test file gets imported when it's collected
+    modules_before = set(sys.modules)
+    report = yield
+    if report.passed:
+        collector.session.stash.setdefault(_imported_modules_key, {})[collector.path] = (
+            project_module_files(
+                cast("ModuleType", collector.obj),
+                set(sys.modules) - modules_before,
+                collector.config.rootpath,
+            )
+        )
+    return report
+
+
 def pytest_collect_file(parent: Collector, file_path: Path) -> Collector | None:
-    if file_path.suffix == ".robot":
+    if _is_robot_file(file_path) and parent.config.option.robot_files:  # pyright:ignore[reportAny]
         return cast(
             Collector,
             RobotFile.from_parent(  # pyright:ignore[reportUnknownMemberType]
@@ -578,6 +1124,10 @@ def pytest_collect_file(parent: Collector, file_path: Path) -> Collector | None:
 
 @hookimpl(wrapper=True)
 def pytest_runtest_setup(item: Item) -> HookWrapperResult:
+    robot_process_worker = item.session.stash.get(_robot_process_worker_key, None)
+    if robot_process_worker and not item.session.shouldfail:
+        # the controller knows about the failures from all of the processes (see `--maxfail`)
+        item.session.shouldfail = robot_process_worker.stop_reason() or False
     should_fail = item.session.shouldfail
     if should_fail:
         # this is usually handled in `pytest_runtestloop`, but since we replace it we need to
@@ -649,10 +1199,226 @@ def pytest_runtestloop(session: Session) -> object:
         # are going to run robot, in which case we need to run it here to generate an empty log cuz
         # that's how robot normally behaves
         return None
+    processes = cast(int, session.config.option.robot_processes)
+    if processes and session.items and _robot_process_worker_key not in session.stash:
+        _run_robot_processes(session, processes)
+        return True
     _robot_run_tests(session)
     return True
 
 
+_robot_processes_key = StashKey[list[RobotProcess]]()
+"""the processes started by `--robot-processes`"""
+
+_robot_process_worker_key = StashKey[RobotProcessWorker]()
+"""set if this is one of the processes started by `--robot-processes`"""
+
+
+def _run_robot_processes(session: Session, processes: int):
+    directory = _xdist_temp_dir(session) / "robot_processes"
+    robot_processes = session.stash[_robot_processes_key] = [
+        RobotProcess(session.config, directory / str(index), items)
+        for index, items in enumerate(
+            partition_items(session.items, processes, _previous_test_durations(session))
+        )
+    ]
+    run_robot_processes(session, robot_processes)
+
+
+def _previous_test_durations(session: Session) -> dict[str, float]:
+    """the durations of the tests from the previous runs. falls back to the output from the previous
+    run (which doesn't get overwritten until the end of this one) if there's no history"""
+    history = duration_history(session.config)
+    durations = history.averages() if history else {}
+    if durations:
+        return durations
+    output = RobotSettings(_get_robot_args(session)).output
+    return {} if output is None else durations_from_output(Path(output), session.config.rootpath)
+
+
+_result_cache_key = StashKey[RobotResultCache]()
+
+_unchanged_tests_key = StashKey[list[str]]()
+"""the nodeids of the tests that were skipped by `--robot-result-cache`, whose results get taken
+from the previous run"""
+
+
+def _result_cache_dir(session: Session) -> Path:
+    return _xdist_temp_dir(session) / "robot_result_cache"
+
+
+def _deselect_unchanged_tests(session: Session, items: list[Item]):
+    # the cache doesn't exist when the cacheprovider plugin is disabled
+    cache = cast(Optional[Cache], getattr(session.config, "cache", None))
+    if cache is None:
+        return
+    result_cache = session.stash[_result_cache_key] = RobotResultCache(
+        cache,
+        robot_args=_get_robot_args(session),
+        rootdir=session.config.rootpath,
+        imported_modules=session.stash.get(_imported_modules_key, {}),
+    )
+    unchanged = result_cache.unchanged_items(items)
+    if not unchanged:
+        return
+    session.stash[_unchanged_tests_key] = [item.nodeid for item in unchanged]
+    unchanged_nodeids = set(session.stash[_unchanged_tests_key])
+    items[:] = [item for item in items if item.nodeid not in unchanged_nodeids]
+    session.config.hook.pytest_deselected(items=unchanged)
+
+
+def _unchanged_test_outputs(session: Session) -> list[Path]:
+    """writes the results of the tests skipped by `--robot-result-cache` to an output that can be
+    merged with the one from this run"""
+    nodeids = session.stash.get(_unchanged_tests_key, None)
+    if not nodeids:
+        return []
+    output = _result_cache_dir(session) / "unchanged.xml"
+    session.stash[_result_cache_key].write_results(nodeids, output)
+    return [output]
+
+
+def _update_result_cache(session: Session):
+    result_cache = session.stash.get(_result_cache_key, None)
+    if result_cache is None:
+        return
+    output = RobotSettings(_get_robot_args(session)).output
+    result_cache.update(session.items, None if output is None else Path(output))
+    result_cache.save()
+
+
+_test_durations_key = StashKey[dict[str, float]]()
+"""how long each test took in this session according to its reports, which get added to the
+duration history at the end of the session"""
+
+
+def _update_duration_history(session: Session):
+    history = duration_history(session.config)
+    durations = session.stash.get(_test_durations_key, None)
+    if history is None or not durations:
+        return
+    history.update(durations)
+
+
+def _should_order_items(session: Session) -> bool:
+    """whether robot should run the tests in the same order as the items instead of its own order.
+    this isn't done by default because robot orders the suites differently to pytest (eg. robot
+    runs the tests in a file after the ones in its classes). xdist runs the items in whatever order
+    its scheduler decides so it isn't supported there"""
+    return not is_xdist(session) and cast(bool, session.config.option.robot_failed_first)
+
+
+def _order_failed_first(session: Session, items: list[Item]):
+    """moves the tests that failed in the previous run's output to the start, followed by the tests
+    in the files modified since then with the most recently modified first"""
+    output = RobotSettings(_get_robot_args(session)).output
+    if output is None or not Path(output).exists():
+        return
+    output_path = Path(output)
+    failures = failures_from_output(output_path, session.config.rootpath)
+    last_run = output_path.stat().st_mtime
+    modified_times: dict[Path, float] = {}
+
+    def priority(item: Item) -> tuple[int, float]:
+        if item.nodeid in failures:
+            return (0, 0)
+        modified_time = modified_times.get(item.path)
+        if modified_time is None:
+            modified_time = modified_times[item.path] = item.path.stat().st_mtime
+        return (1, -modified_time) if modified_time > last_run else (2, 0)
+
+    items.sort(key=priority)
+
+
+def _group_items_by_suite(items: list[Item]) -> list[Item]:
+    """robot runs all the tests in a suite together, so the items from each directory, file and
+    class need to be next to each other, in the order that their first items appear. robot also runs
+    a suite's child suites before its tests, so those items go first"""
+    first_indexes: dict[tuple[str, ...], int] = {}
+
+    def key(index_and_item: tuple[int, Item]) -> list[tuple[bool, int]]:
+        index, item = index_and_item
+        file, *classes, _ = item.nodeid.split("::")
+        suites = [*file.split("/"), *classes]
+        return [
+            (False, first_indexes.setdefault(tuple(suites[: depth + 1]), index))
+            for depth in range(len(suites))
+        ] + [(True, index)]
+
+    # the keys have to be computed in the original order so that the first index of each suite is
+    # its first item
+    keys = [key(index_and_item) for index_and_item in enumerate(items)]
+    return [item for _, item in sorted(zip(keys, items), key=itemgetter(0))]
+
+
+@hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Config, items: list[Item]):
+    session = current_session()
+    if session is None or is_xdist(session):
+        return
+    if config.option.robot_failed_first:  # pyright:ignore[reportAny]
+        _order_failed_first(session, items)
+    # the controller already worked out which tests were unchanged
+    if config.option.robot_result_cache and _robot_process_worker_key not in session.stash:  # pyright:ignore[reportAny]
+        _deselect_unchanged_tests(session, items)
+
+
+def _order_suites_by_duration(session: Session, items: list[Item]) -> list[Item]:
+    """moves the files whose tests took the longest in the previous runs to the start, keeping the
+    tests in each file together and in their original order.
+
+    this is done on each xdist worker before its collection gets sent to the controller, so that
+    `--xdist-robot-suite-scheduling` assigns the slowest suites to the workers first. every worker
+    reads the same durations so they still end up with the same collection"""
+    estimate = duration_estimator(_previous_test_durations(session))
+    items_by_file: dict[Path, list[Item]] = {}
+    for item in items:
+        items_by_file.setdefault(item.path, []).append(item)
+    return [
+        item
+        for file_items in sorted(
+            items_by_file.values(),
+            key=lambda file_items: -estimate(item.nodeid for item in file_items),
+        )
+        for item in file_items
+    ]
+
+
+@hookimpl(tryfirst=True)
+def pytest_collection_finish(session: Session):
+    # this is done here instead of in pytest_collection_modifyitems because pytest's --ff and --nf
+    # can still reorder the items after all the other pytest_collection_modifyitems hooks
+    if _should_order_items(session):
+        session.items = _group_items_by_suite(session.items)
+    elif is_xdist_worker(session) and session.config.option.xdist_robot_suite_scheduling:  # pyright:ignore[reportAny]
+        session.items = _order_suites_by_duration(session, session.items)
+
+
+def pytest_runtest_logreport(report: TestReport):
+    session = current_session()
+    if session is None:
+        return
+    robot_process_worker = session.stash.get(_robot_process_worker_key, None)
+    if robot_process_worker:
+        robot_process_worker.send_report(session.config, report)
+    # the reports from xdist workers and robot processes end up here in the main process as well
+    elif not is_xdist_worker(session):
+        durations = session.stash.setdefault(_test_durations_key, {})
+        durations[report.nodeid] = durations.get(report.nodeid, 0) + report.duration
+
+
+@hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: Config, log: Producer) -> LoadFileScheduling | None:
+    if not config.option.xdist_robot_suite_scheduling:  # pyright:ignore[reportAny]
+        return None
+    # xdist is installed if this hook is being called
+    from xdist.scheduler import LoadFileScheduling  # noqa: PLC0415
+
+    # the scheduler assigns the files in the order that the workers collected them, which is
+    # longest first (see `_order_suites_by_duration`)
+    return LoadFileScheduling(config, log)
+
+
 @hookimpl(tryfirst=True)
 def pytest_runtest_protocol(item: Item):
     if is_xdist_worker(item.session):
@@ -669,8 +1435,24 @@ def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config):
     if not args or not args["log"]:
         return
     log_file = Path(args["outputdir"], args["log"]).absolute()
+    background_rebot = config.stash.get(_background_rebot_key, None)
+    # the process usually won't have finished yet, but if it's already failed then the log won't
+    # ever get generated
+    if background_rebot and background_rebot[0].poll():
+        terminalreporter.line("")
+        terminalreporter.line(
+            "failed to generate the Robot Framework log in the background, see"
+            + f" {background_rebot_errors_file(background_rebot[1]).absolute()}",
+            red=True,
+        )
+        return
     terminalreporter.line("")
-    terminalreporter.line("Robot Framework Log File:", bold=True)
+    terminalreporter.line(
+        "Robot Framework Log File"
+        + (" (generating in the background)" if background_rebot else "")
+        + ":",
+        bold=True,
+    )
     terminalreporter.line(f"Log:     {log_file}")
     terminalreporter.line(f"Log URI: {log_file.as_uri()}")
 
@@ -0,0 +1,255 @@
+"""caches the results of the tests that passed along with a fingerprint of the files they depend on,
+so that tests that passed last time and whose files haven't changed can be skipped (see
+`--robot-result-cache`)"""
+
+from __future__ import annotations
+
+import json
+import sys
+import sysconfig
+import xml.etree.ElementTree as ET  # noqa: S405
+from hashlib import sha256
+from importlib.util import find_spec
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, TypedDict, cast
+
+from robot.version import VERSION
+
+from pytest_robotframework._internal.robot.durations import (
+    output_attributes,
+    passed_tests_from_output,
+)
+from pytest_robotframework._internal.robot.utils import running_test_case_key
+from pytest_robotframework._internal.utils import cache_key
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping
+
+    from pytest import Cache, Item
+    from robot import running
+
+    from pytest_robotframework._internal.robot.durations import PassedTest
+
+
+class _Cache(TypedDict):
+    key: str
+    tests: dict[str, dict[str, str]]
+    """the hash of each file that a passed test depends on, keyed by its nodeid"""
+
+
+class _CachedResults(TypedDict):
+    robot: dict[str, str]
+    """the attributes of the root element of the output that the results came from"""
+    tests: dict[str, PassedTest]
+    """the result of each passed test, keyed by its nodeid"""
+
+
+def _library_file(name: str) -> Path | None:
+    """the file for a python library imported by name, if it can be found without importing it"""
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    return Path(spec.origin) if spec and spec.origin and Path(spec.origin).is_file() else None
+
+
+def project_module_files(module: ModuleType, imported: Iterable[str], rootdir: Path) -> set[Path]:
+    """the files of the modules in the project that a python test file depends on, which is every
+    module in `rootdir` (apart from installed packages) that it imported.
+
+    :param imported: the names of the modules that were imported while the test file was being
+    imported. the modules that were already imported by then (eg. by a previous test file) are
+    found from the test file's globals instead
+    """
+    modules = {module, *(sys.modules[name] for name in imported if name in sys.modules)}
+    for value in cast(dict[str, object], vars(module)).values():
+        if isinstance(value, ModuleType):
+            modules.add(value)
+            continue
+        # functions and classes imported from another module
+        module_name = cast(object, getattr(value, "__module__", None))
+        if isinstance(module_name, str) and module_name in sys.modules:
+            modules.add(sys.modules[module_name])
+    install_paths = {Path(sysconfig.get_path(name)) for name in ("purelib", "platlib")}
+    files: set[Path] = set()
+    for imported_module in modules:
+        file = cast(Optional[str], getattr(imported_module, "__file__", None))
+        if file is None:
+            continue
+        path = Path(file)
+        if path.is_relative_to(rootdir) and not any(
+            path.is_relative_to(install_path) for install_path in install_paths
+        ):
+            files.add(path)
+    return files
+
+
+class RobotResultCache:
+    """the tests that passed in previous runs, along with the hashes of the files they depended on
+    and their results from the output.
+
+    the files a test depends on are its source file, any `conftest.py` and `__init__` files in its
+    directory or above, the resources and libraries imported by its robot suites, the libraries of
+    the keywords it ran, and for python tests, the modules in the project that its file imports.
+
+    the whole cache gets invalidated if the robot options change, like the collection cache"""
+
+    _cache_key = "pytest_robotframework/passed_tests"
+
+    def __init__(
+        self,
+        cache: Cache,
+        *,
+        robot_args: Mapping[str, object],
+        rootdir: Path,
+        imported_modules: Mapping[Path, Collection[Path]],
+    ):
+        """
+        :param imported_modules: the files from `project_module_files` for each python test file
+        """
+        super().__init__()
+        self._pytest_cache = cache
+        self.rootdir = rootdir
+        self._imported_modules = imported_modules
+        self._key = cache_key([
+            VERSION,
+            {key: value for key, value in robot_args.items() if key != "listener"},
+        ])
+        self._results_file = Path(cache.mkdir("pytest_robotframework_results")) / "results.json"
+        """the results of the passed tests, which are only read when some of them are skipped"""
+        self._results: _CachedResults | None = None
+        cached = cast(Optional[_Cache], cache.get(self._cache_key, None))
+        self._tests: dict[str, dict[str, str]] = (
+            cached["tests"]
+            if cached and cached["key"] == self._key and self._results_file.exists()
+            else {}
+        )
+        self._hashes: dict[Path, str | None] = {}
+        """the hash of each file as of the start of this run, so that each file only gets hashed
+        once"""
+        self._resource_files: set[Path] | None = None
+
+    def _hash(self, path: Path) -> str | None:
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                self._hashes[path] = None
+        return self._hashes[path]
+
+    def _is_unchanged(self, nodeid: str) -> bool:
+        files = self._tests.get(nodeid)
+        return files is not None and all(
+            self._hash(Path(path)) == file_hash for path, file_hash in files.items()
+        )
+
+    def _cached_results(self) -> _CachedResults:
+        if self._results is None:
+            try:
+                self._results = cast(
+                    _CachedResults, json.loads(self._results_file.read_text(encoding="utf8"))
+                )
+            except (OSError, ValueError):
+                self._results = {"robot": {}, "tests": {}}
+        return self._results
+
+    def unchanged_items(self, items: Iterable[Item]) -> list[Item]:
+        """the items that passed last time and none of the files they depend on have changed"""
+        return [
+            item
+            for item in items
+            if self._is_unchanged(item.nodeid) and item.nodeid in self._cached_results()["tests"]
+        ]
+
+    def _dependencies(self, item: Item, libraries: Iterable[str]) -> set[Path]:
+        files = {item.path, *self._imported_modules.get(item.path, ())}
+        directory = item.path.parent
+        while directory.is_relative_to(self.rootdir):
+            files.update(path for path in directory.glob("__init__.*") if path.is_file())
+            if (directory / "conftest.py").is_file():
+                files.add(directory / "conftest.py")
+            if directory == self.rootdir:
+                break
+            directory = directory.parent
+        test = item.stash.get(running_test_case_key, None)
+        if test is None and item.path.suffix != ".py":
+            # the robot suite isn't available if the test ran in another process (see
+            # `--robot-processes`), so assume that it could use any of the resource files
+            if self._resource_files is None:
+                self._resource_files = set(self.rootdir.rglob("*.resource"))
+            files |= self._resource_files
+        suite = cast(Optional["running.TestSuite"], test.parent if test else None)
+        while suite:
+            for robot_import in suite.resource.imports:
+                path = Path(robot_import.directory or "") / robot_import.name
+                if path.is_file():
+                    files.add(path)
+                elif robot_import.type == "LIBRARY" and (
+                    library_file := _library_file(robot_import.name)
+                ):
+                    files.add(library_file)
+            suite = cast(Optional["running.TestSuite"], suite.parent)
+        files.update(path for library in libraries if (path := _library_file(library)))
+        return files
+
+    def update(self, items: Iterable[Item], output: Path | None):
+        """records the results of the items that ran in this session.
+
+        :param output: the output from this run, which the results get read from
+        """
+        if output is None or not output.exists():
+            self._tests = {}
+            self._results = {"robot": {}, "tests": {}}
+            return
+        passed_tests = passed_tests_from_output(output, self.rootdir)
+        results = self._cached_results()
+        results["robot"] = output_attributes(output)
+        for item in items:
+            passed_test = passed_tests.get(item.nodeid)
+            if passed_test is None:
+                _ = self._tests.pop(item.nodeid, None)
+                _ = results["tests"].pop(item.nodeid, None)
+                continue
+            hashes = {
+                str(path): self._hash(path)
+                for path in self._dependencies(item, passed_test["libraries"])
+            }
+            self._tests[item.nodeid] = {
+                path: file_hash for path, file_hash in hashes.items() if file_hash is not None
+            }
+            results["tests"][item.nodeid] = passed_test
+
+    def write_results(self, nodeids: Collection[str], output: Path):
+        """writes the results of the specified tests from the previous runs to `output`"""
+        results = self._cached_results()
+        root = ET.Element("robot", results["robot"])
+        # the suite elements for each path of suites, so that tests in the same suite end up in it
+        # together
+        suites: dict[tuple[tuple[str, str], ...], ET.Element] = {}
+        for nodeid in nodeids:
+            test = results["tests"][nodeid]
+            parent = root
+            path: tuple[tuple[str, str], ...] = ()
+            for name, source in test["suites"]:
+                path = (*path, (name, source))
+                if path not in suites:
+                    suites[path] = ET.SubElement(
+                        parent, "suite", {"name": name, **({"source": source} if source else {})}
+                    )
+                parent = suites[path]
+            # the results were written by robot so they aren't untrusted
+            parent.append(ET.fromstring(test["result"]))  # noqa: S314
+        output.parent.mkdir(parents=True, exist_ok=True)
+        ET.ElementTree(root).write(output, encoding="utf-8", xml_declaration=True)
+
+    def save(self):
+        if self._results is not None:
+            # only the results of the tests that are still in the cache are needed
+            self._results["tests"] = {
+                nodeid: result
+                for nodeid, result in self._results["tests"].items()
+                if nodeid in self._tests
+            }
+            _ = self._results_file.write_text(json.dumps(self._results), encoding="utf8")
+        self._pytest_cache.set(self._cache_key, {"key": self._key, "tests": self._tests})
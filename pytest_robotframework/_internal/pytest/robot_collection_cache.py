@@ -0,0 +1,177 @@
+"""caches the tests collected from `.robot` files in pytest's cache directory, so that robot only
+needs to parse the files that changed since the last run during collection"""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TypedDict, cast
+
+from robot import running
+from robot.version import VERSION
+
+from pytest_robotframework._internal.robot.utils import ModelTestSuite
+from pytest_robotframework._internal.utils import cache_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from pytest import Cache
+
+    from pytest_robotframework._internal.robot.utils import ModelTestCase
+
+
+class _CachedTest(TypedDict):
+    name: str
+    lineno: int | None
+    tags: list[str]
+    suites: list[tuple[str, str | None]]
+    """the name and source of each suite the test is in, starting with the top level suite"""
+
+
+class _CachedFile(TypedDict):
+    mtime: int
+    size: int
+    hash: str
+    tests: list[_CachedTest]
+
+
+class _Cache(TypedDict):
+    key: str
+    files: dict[str, _CachedFile]
+
+
+def _hash_file(path: Path) -> str:
+    return sha256(path.read_bytes()).hexdigest()
+
+
+def is_init_file(path: Path) -> bool:
+    return path.stem.lower() == "__init__"
+
+
+class RobotCollectionCache:
+    """the tests collected from each `.robot` file, along with the size, modified time and hash of
+    the file when they were collected.
+
+    the whole cache gets invalidated if the robot options or the collection paths change, since
+    they can affect the names and tags of the tests"""
+
+    _cache_key = "pytest_robotframework/collected_robot_tests"
+
+    def __init__(
+        self,
+        cache: Cache,
+        *,
+        robot_args: Mapping[str, object],
+        collection_paths: Iterable[Path],
+        files: Iterable[Path],
+    ):
+        super().__init__()
+        self._pytest_cache = cache
+        self._key = cache_key([
+            VERSION,
+            sorted(str(path) for path in collection_paths),
+            # listeners aren't used during collection
+            {key: value for key, value in robot_args.items() if key != "listener"},
+        ])
+        self.files = {str(file): file for file in files}
+        """all the files robot would parse during collection, including `__init__` files"""
+        cached = cast(Optional[_Cache], cache.get(self._cache_key, None))
+        self._cached_files: dict[str, _CachedFile] = (
+            cached["files"] if cached and cached["key"] == self._key else {}
+        )
+        self.stale_files: list[Path] = []
+        """files that have been added or modified since the last time they were collected"""
+        for name, path in self.files.items():
+            cached_file = self._cached_files.get(name)
+            if cached_file is None:
+                self.stale_files.append(path)
+                continue
+            stat = path.stat()
+            if cached_file["mtime"] == stat.st_mtime_ns and cached_file["size"] == stat.st_size:
+                continue
+            # the file was touched (eg. by a git checkout) but may not have actually changed
+            if cached_file["size"] == stat.st_size and cached_file["hash"] == _hash_file(path):
+                cached_file["mtime"] = stat.st_mtime_ns
+            else:
+                self.stale_files.append(path)
+
+    @property
+    def needs_full_collection(self) -> bool:
+        """whether every file needs to be collected again. this is the case when an `__init__` file
+        was modified, added or removed, since they can change the names and tags of the tests in any
+        other file in their directory"""
+        return any(is_init_file(file) for file in self.stale_files) or any(
+            is_init_file(Path(name)) and name not in self.files for name in self._cached_files
+        )
+
+    def update(self, tests: Iterable[ModelTestCase], *, files: Iterable[Path]):
+        """replaces the cached tests for `files` with the ones robot just collected from them"""
+        tests_by_file: dict[str, list[_CachedTest]] = {}
+        for test in tests:
+            suites: list[tuple[str, str | None]] = []
+            suite = cast(Optional[ModelTestSuite], test.parent)
+            while suite:
+                suites.insert(0, (suite.name, str(suite.source) if suite.source else None))
+                suite = cast(Optional[ModelTestSuite], suite.parent)
+            tests_by_file.setdefault(str(test.source), []).append({
+                "name": test.name,
+                "lineno": test.lineno,
+                "tags": list(test.tags),
+                "suites": suites,
+            })
+        for file in files:
+            stat = file.stat()
+            self._cached_files[str(file)] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": _hash_file(file),
+                "tests": tests_by_file.get(str(file), []),
+            }
+
+    def save(self):
+        self._pytest_cache.set(
+            self._cache_key,
+            {
+                "key": self._key,
+                # drop any files that no longer exist
+                "files": {
+                    name: cached_file
+                    for name, cached_file in self._cached_files.items()
+                    if name in self.files
+                },
+            },
+        )
+
+    def tests(self, *, exclude: Iterable[Path] = ()) -> dict[Path, list[ModelTestCase]]:
+        """creates the tests from the cache. they are only used for their metadata so they don't
+        have any keywords in them, but they are put in suites that have the same names as the
+        original ones so that their full names match"""
+        excluded = {str(path) for path in exclude}
+        suites: dict[tuple[tuple[str, str | None], ...], running.TestSuite] = {}
+        result: dict[Path, list[ModelTestCase]] = {}
+        for name, cached_file in self._cached_files.items():
+            if name in excluded or name not in self.files:
+                continue
+            for cached_test in cached_file["tests"]:
+                parent: running.TestSuite | None = None
+                chain = tuple(
+                    (suite_name, suite_source) for suite_name, suite_source in cached_test["suites"]
+                )
+                for index, (suite_name, suite_source) in enumerate(chain):
+                    suite = suites.get(chain[: index + 1])
+                    if suite is None:
+                        suite = running.TestSuite(
+                            name=suite_name, source=Path(suite_source) if suite_source else None
+                        )
+                        if parent:
+                            _ = parent.suites.append(suite)
+                        suites[chain[: index + 1]] = suite
+                    parent = suite
+                if parent is None:
+                    continue
+                test = parent.tests.create(
+                    name=cached_test["name"], lineno=cached_test["lineno"], tags=cached_test["tags"]
+                )
+                result.setdefault(self.files[name], []).append(test)
+        return result
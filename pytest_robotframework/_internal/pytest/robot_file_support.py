@@ -4,18 +4,21 @@ from __future__ import annotations
 
 import dataclasses
 from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING, Callable, cast
 
 from _pytest._code.code import ReprFileLocation, TerminalRepr
 from pytest import Config, ExceptionInfo, File, Item, MarkDecorator, Session, StashKey, mark, skip
-from robot import model
+from robot import model, running
 from robot.errors import ExecutionFailed, ExecutionFailures, RobotError
 from robot.libraries.BuiltIn import BuiltIn
 from robot.running.bodyrunner import BodyRunner
+from robot.running.builder.parsers import RobotParser
 from robot.running.model import Body
 from robot.running.statusreporter import StatusReporter
 from typing_extensions import Concatenate, override
 
+from pytest_robotframework._internal.cringe_globals import current_session
 from pytest_robotframework._internal.errors import InternalError
 from pytest_robotframework._internal.robot.utils import (
     ModelTestCase,
@@ -35,9 +38,11 @@ if TYPE_CHECKING:
     from _pytest._code.code import TracebackStyle
     from _pytest._io import TerminalWriter
     from basedtyping import P
+    from robot.running.builder.settings import TestDefaults
 
 
-collected_robot_tests_key = StashKey[list[ModelTestCase]]()
+collected_robot_tests_key = StashKey[dict[Path, list[ModelTestCase]]]()
+"""the tests collected from each `.robot` file"""
 original_setup_key = StashKey[model.Keyword]()
 original_body_key = StashKey[Body]()
 original_teardown_key = StashKey[model.Keyword]()
@@ -59,14 +64,74 @@ def _get_failure(  # pyright: ignore[reportUnusedFunction]
     return result
 
 
+class ParsedRobotSuites:
+    """the suites robot parsed from `.robot` files during collection. when not running with xdist,
+    these get given to robot again when it runs the tests so that it doesn't need to parse the same
+    files twice"""
+
+    def __init__(self, *, copy: bool):
+        """
+        :param copy: whether to save a copy of each suite instead of the suite itself. this is
+        required if anything other than `RobotSuiteCollector` (ie. a user-defined prerunmodifier)
+        could modify the suites during collection
+        """
+        super().__init__()
+        self.copy = copy
+        self.saving = True
+        """whether robot is currently running in collection mode, where the suites it parses should
+        be saved rather than reused"""
+        self.suites: dict[Path, tuple[running.TestSuite, list[running.TestCase], str]] = {}
+        """the suite parsed from each file, along with its tests (which are saved separately because
+        `RobotSuiteCollector` removes them from the suite) and the defaults they were parsed with"""
+
+    @staticmethod
+    def defaults_key(defaults: TestDefaults) -> str:
+        """the defaults from `__init__` files get applied to the tests when the file is parsed, so
+        if they're different (eg. because the run uses a different `__init__` file) the suite can't
+        be reused"""
+        return repr((defaults.setup, defaults.teardown, defaults.tags, defaults.timeout))
+
+
+parsed_robot_suites_key = StashKey[ParsedRobotSuites]()
+
+
+@patch_method(RobotParser)
+def parse_suite_file(  # pyright:ignore[reportUnusedFunction]
+    og: Callable[[RobotParser, Path, TestDefaults], running.TestSuite],
+    self: RobotParser,
+    source: Path,
+    defaults: TestDefaults,
+) -> running.TestSuite:
+    session = current_session()
+    parsed_suites = session.stash.get(parsed_robot_suites_key, None) if session else None
+    if parsed_suites is None:
+        return og(self, source, defaults)
+    if not parsed_suites.saving:
+        saved = parsed_suites.suites.pop(source, None)
+        if saved is None:
+            return og(self, source, defaults)
+        suite, tests, defaults_key = saved
+        if defaults_key != parsed_suites.defaults_key(defaults):
+            return og(self, source, defaults)
+        suite.tests = tests
+        return suite
+    suite = og(self, source, defaults)
+    saved_suite = suite.deepcopy() if parsed_suites.copy else suite
+    parsed_suites.suites[source] = (
+        saved_suite,
+        list(saved_suite.tests),
+        parsed_suites.defaults_key(defaults),
+    )
+    return suite
+
+
 class RobotFile(File):
     @override
     def collect(self) -> Iterable[Item]:
-        for test in self.session.stash[collected_robot_tests_key]:
-            if self.path == test.source:
-                yield RobotItem.from_parent(  # pyright:ignore[reportUnknownMemberType]
-                    self, name=test.name, robot_test=test
-                )
+        for test in self.session.stash[collected_robot_tests_key].get(self.path, []):
+            yield RobotItem.from_parent(  # pyright:ignore[reportUnknownMemberType]
+                self, name=test.name, robot_test=test
+            )
 
 
 class RobotItem(Item):
@@ -0,0 +1,209 @@
+"""running the tests in parallel without xdist (see `--robot-processes`). the controller splits the
+items up by suite and starts a separate pytest process for each group, which only collects those
+items, runs robot once on all of them and sends the test reports back to the controller as they
+come in"""
+
+from __future__ import annotations
+
+import json
+import sys
+from subprocess import DEVNULL, STDOUT, Popen  # noqa: S404
+from time import sleep
+from typing import IO, TYPE_CHECKING, cast
+
+from pytest_robotframework._internal.errors import InternalError
+from pytest_robotframework._internal.pytest.duration_history import duration_estimator
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from pytest import Config, Item, Session, TestReport
+
+_items_file_name = "items.txt"
+_reports_file_name = "reports.jsonl"
+_log_file_name = "pytest.log"
+_stop_file_name = "stop"
+output_file_name = "output.xml"
+"""the name of the robot output that each process writes to its directory"""
+
+
+def partition_items(
+    items: Sequence[Item], processes: int, durations: Mapping[str, float]
+) -> list[list[Item]]:
+    """splits the items up into at most `processes` groups, keeping the items from each file (ie.
+    each top level robot suite) together so that their suite setup/teardown only runs once. the
+    suites are balanced across the groups longest first, using the durations from a previous run"""
+    suites: dict[Path, list[Item]] = {}
+    for item in items:
+        suites.setdefault(item.path, []).append(item)
+    estimate = duration_estimator(durations)
+
+    def suite_duration(suite: list[Item]) -> float:
+        return estimate(item.nodeid for item in suite)
+
+    partitions: list[list[Item]] = [[] for _ in range(processes)]
+    totals = [0.0] * processes
+    for suite in sorted(suites.values(), key=suite_duration, reverse=True):
+        index = totals.index(min(totals))
+        partitions[index].extend(suite)
+        totals[index] += suite_duration(suite)
+    return [partition for partition in partitions if partition]
+
+
+class RobotProcess:
+    """a pytest process started by the controller to run some of the items"""
+
+    def __init__(self, config: Config, directory: Path, items: Sequence[Item]):
+        super().__init__()
+        self.directory = directory
+        directory.mkdir(parents=True)
+        _ = (directory / _items_file_name).write_text("\n".join(item.nodeid for item in items))
+        reports_file = directory / _reports_file_name
+        reports_file.touch()
+        self._reports: IO[bytes] = reports_file.open("rb")
+        self._incomplete_line = b""
+        with (directory / _log_file_name).open("wb") as log:
+            self._process = Popen(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "pytest",
+                    *config.invocation_params.args,
+                    # these need to come after the user's arguments so that they take precedence
+                    f"--basetemp={directory / 'basetemp'}",
+                    f"--robot-process-dir={directory}",
+                ],
+                cwd=config.invocation_params.dir,
+                stdin=DEVNULL,
+                stdout=log,
+                stderr=STDOUT,
+            )
+
+    def read_reports(self) -> list[dict[str, object]]:
+        """reads any new reports that the process has written since the last time this was
+        called"""
+        lines = (self._incomplete_line + self._reports.read()).split(b"\n")
+        # the process may be part way through writing the last line
+        self._incomplete_line = lines.pop()
+        return [cast(dict[str, object], json.loads(line)) for line in lines]
+
+    def stop(self, reason: str):
+        """tells the process to skip the rest of its tests, like pytest does when `--maxfail` is
+        reached"""
+        _ = (self.directory / _stop_file_name).write_text(reason, encoding="utf8")
+
+    def kill(self):
+        """kills the process if it's still running, eg. if the controller was interrupted"""
+        if self.running:
+            self._process.kill()
+            _ = self._process.wait()
+        self._reports.close()
+
+    def finish(self):
+        self._reports.close()
+        # exit codes 1 and 5 mean some tests failed and no tests were run, which the controller
+        # knows about from the reports
+        if self._process.returncode not in {0, 1, 5}:
+            log = (self.directory / _log_file_name).read_text(errors="replace")
+            raise InternalError(
+                f"pytest process in {self.directory} failed with exit code"
+                + f" {self._process.returncode}:\n{log}"
+            )
+
+    @property
+    def running(self) -> bool:
+        return self._process.poll() is None
+
+
+def run_robot_processes(session: Session, processes: Sequence[RobotProcess]):
+    """waits for the processes to finish, passing the reports from them to the hooks in this process
+    (eg. so that they show up in the terminal) as they come in"""
+    hook = session.config.hook
+    stopped = False
+    try:
+        while True:
+            # this needs to be checked before reading the reports, otherwise the last reports could
+            # get missed if a process finishes after its reports are read
+            running = any(process.running for process in processes)
+            for process in processes:
+                for data in process.read_reports():
+                    report = cast(
+                        "TestReport",
+                        hook.pytest_report_from_serializable(config=session.config, data=data),
+                    )
+                    if report.when == "setup":
+                        hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+                    hook.pytest_runtest_logreport(report=report)
+                    if report.when == "teardown":
+                        hook.pytest_runtest_logfinish(
+                            nodeid=report.nodeid, location=report.location
+                        )
+            if not running:
+                break
+            # pytest sets these when the reports are passed to its hooks (eg. `--maxfail`), but
+            # since the tests are running in the other processes they have to be told to stop
+            should_stop = session.shouldfail or session.shouldstop
+            if should_stop and not stopped:
+                stopped = True
+                for process in processes:
+                    process.stop(
+                        "the rest of the tests were skipped"
+                        if isinstance(should_stop, bool)
+                        else should_stop
+                    )
+            sleep(0.05)
+    finally:
+        for process in processes:
+            process.kill()
+    for process in processes:
+        process.finish()
+
+
+class RobotProcessWorker:
+    """the state of a pytest process started by the controller"""
+
+    def __init__(self, directory: Path, args: Sequence[str]):
+        """
+        :param args: the arguments that pytest was run with, which the controller collected the
+        items from
+        """
+        super().__init__()
+        self.directory = directory
+        self.args = args
+        """robot still runs from these instead of `collection_args`, so that its suites are the same
+        as the ones in the controller"""
+        self.nodeids = (directory / _items_file_name).read_text().splitlines()
+        """the items that the controller wants this process to run"""
+        self._reports = (directory / _reports_file_name).open("a", encoding="utf8")
+
+    def collection_args(self, rootdir: Path) -> list[str]:
+        """the arguments to collect the items from instead of the ones that the controller collected
+        everything from"""
+        args: list[str] = []
+        for nodeid in self.nodeids:
+            file, separator, rest = nodeid.partition("::")
+            args.append(f"{rootdir / file}{separator}{rest}")
+        return args
+
+    def stop_reason(self) -> str | None:
+        """set if the controller wants this process to skip the rest of its tests"""
+        try:
+            return (self.directory / _stop_file_name).read_text(encoding="utf8")
+        except FileNotFoundError:
+            return None
+
+    @property
+    def output(self) -> Path:
+        return self.directory / output_file_name
+
+    def send_report(self, config: Config, report: TestReport):
+        data = cast(
+            dict[str, object],
+            config.hook.pytest_report_to_serializable(config=config, report=report),
+        )
+        _ = self._reports.write(json.dumps(data) + "\n")
+        self._reports.flush()
+
+    def close(self):
+        self._reports.close()
@@ -0,0 +1,128 @@
+"""converting the ansi escape codes in log messages (eg. from pytest's coloured assertion diffs) to
+html"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from ansi2html import Ansi2HTMLConverter
+from robot.model import SuiteVisitor
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from robot.model import Message
+
+esc = "\N{ESCAPE}"
+
+deferred_esc = "\N{SYMBOL FOR ESCAPE}"
+"""replaces the escape character in messages that get converted when the log is generated instead
+(see `--defer-ansi-conversion`), since robot removes escape characters from the output because
+they aren't allowed in xml"""
+
+_deferred_sequence = re.compile(f"{deferred_esc}(.)", re.DOTALL)
+
+escape_codes = re.compile(r"\x1b\[.*?m")
+
+_reset = re.compile(r"\x1b\[0?m")
+"""a code that resets all the styles, after which a message can be split up without the styles
+carrying over"""
+
+_cursor_up = re.compile(r"\x1b\[\d*A")
+"""moves the cursor up, which makes ansi2html remove text that came before it, so a message that
+contains it can't be split up"""
+
+
+def defer_escape_codes(message: str) -> str:
+    """replaces the escape characters in `message` with `deferred_esc`. every `deferred_esc` in the
+    result is the start of a two character sequence, so that any that were already in the message
+    don't get mistaken for escape characters:
+
+    - `␛[` is an escape character followed by `[`, which every escape code starts with
+    - `␛]` is any other escape character
+    - `␛␛` is a `␛` that was already in the message
+    """
+    return (
+        message.replace(deferred_esc, deferred_esc * 2)
+        .replace(f"{esc}[", f"{deferred_esc}[")
+        .replace(esc, f"{deferred_esc}]")
+    )
+
+
+def restore_escape_codes(message: str) -> str:
+    """the opposite of `defer_escape_codes`"""
+    return _deferred_sequence.sub(
+        lambda match: {"[": f"{esc}[", "]": esc}.get(match[1], match[1]), message
+    )
+
+
+class AnsiConverter:
+    chunk_size = 100_000
+    """messages longer than this are converted a chunk at a time (see `_convert_in_chunks`)"""
+
+    def __init__(self):
+        super().__init__()
+        # the converter doesn't keep any state between messages so it can be reused
+        self._converter = Ansi2HTMLConverter(inline=True)
+
+    def _convert_in_chunks(self, message: str) -> str:
+        """converts a large message a chunk at a time, splitting it after the last reset code in
+        each chunk, so that the converter never has to hold the intermediate results for the whole
+        message at once"""
+        chunks: list[str] = []
+        start = 0
+        while len(message) - start > self.chunk_size:
+            end = max(
+                (
+                    reset.end()
+                    for reset in _reset.finditer(message, start + 1, start + self.chunk_size)
+                ),
+                default=None,
+            )
+            if end is None:
+                # no reset in this chunk, so the styles could carry over to the rest of the message
+                break
+            chunks.append(self._converter.convert(message[start:end], full=False))
+            start = end
+        chunks.append(self._converter.convert(message[start:], full=False))
+        return "".join(chunks)
+
+    def convert(self, message: str) -> str:
+        if len(message) > self.chunk_size and not _cursor_up.search(message):
+            return self._convert_in_chunks(message)
+        return self._converter.convert(message, full=False)
+
+
+# this gets imported by name by rebot, so it's not decorated with `catch_errors` since it can run in
+# a separate process
+class DeferredAnsiConverter(SuiteVisitor):
+    """prerebotmodifier that converts the ansi escape codes in the messages that were written to
+    the output without being converted because `--defer-ansi-conversion` was used. you only need to
+    use this if you generate the log from the output yourself:
+
+    .. code-block:: shell
+
+        rebot --prerebotmodifier pytest_robotframework.DeferredAnsiConverter output.xml
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.converter = AnsiConverter()
+
+    @override
+    def visit_message(self, message: Message):
+        if message.html or deferred_esc not in message.message:
+            return
+        restored = restore_escape_codes(message.message)
+        if esc in restored:
+            message.message = self.converter.convert(restored)
+            message.html = True
+        else:
+            message.message = restored
+
+
+deferred_ansi_converter_name = (
+    f"{DeferredAnsiConverter.__module__}.{DeferredAnsiConverter.__name__}"
+)
+"""the name of `DeferredAnsiConverter` for passing to rebot, since it can't be passed as an object
+when the log is generated in the background"""
@@ -0,0 +1,96 @@
+"""generating robot's log and report in a separate process so that pytest doesn't have to wait for
+it (see `--background-robot-log`)"""
+
+from __future__ import annotations
+
+import json
+import sys
+from io import StringIO
+from pathlib import Path
+from subprocess import DEVNULL, Popen  # noqa: S404
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, TypedDict, cast
+
+from robot import rebot
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class _SerializedOptions(TypedDict):
+    options: dict[str, object]
+    tuples: list[str]
+    """the options whose values are tuples, since json turns them into lists and rebot doesn't
+    accept lists for some of them (eg. `reportbackground`)"""
+
+
+def _serialize_options(rebot_options: Mapping[str, object]) -> str | None:
+    """:return: `None` if the options can't be serialized (eg. if a `prerebotmodifier` is an object
+    instead of a string)"""
+    serialized_options: _SerializedOptions = {
+        "options": dict(rebot_options),
+        "tuples": [key for key, value in rebot_options.items() if isinstance(value, tuple)],
+    }
+    try:
+        result = json.dumps(serialized_options)
+    except TypeError:
+        return None
+    # in case there are any tuples in the values that don't get restored
+    return result if _deserialize_options(result) == dict(rebot_options) else None
+
+
+def _deserialize_options(serialized_options: str) -> dict[str, object]:
+    options = cast(_SerializedOptions, json.loads(serialized_options))
+    return {
+        key: tuple(cast(list[object], value)) if key in options["tuples"] else value
+        for key, value in options["options"].items()
+    }
+
+
+def background_rebot_errors_file(output: Path) -> Path:
+    """the file that the errors from rebot get written to if the log and report couldn't be
+    generated from `output`. it only exists if there were errors"""
+    return output.with_name(f"{output.stem}_rebot_errors.txt")
+
+
+def start_background_rebot(
+    output: Path, rebot_options: Mapping[str, object]
+) -> Popen[bytes] | None:
+    """starts a process that runs rebot on `output` and doesn't wait for it to finish. the process
+    exits with a non-zero exit code if there were any errors (see `background_rebot_errors_file`)
+
+    :return: the process, or `None` if it couldn't be started because the options can't be passed
+    to another process (eg. if a `prerebotmodifier` is an object instead of a string)"""
+    serialized_options = _serialize_options(rebot_options)
+    if serialized_options is None:
+        return None
+    # the options get passed in a file since they could be too long for the command line. the
+    # process deletes it once it's read it
+    with NamedTemporaryFile(
+        "w", encoding="utf8", prefix="rebot_options_", suffix=".json", delete=False
+    ) as options_file:
+        _ = options_file.write(serialized_options)
+    return Popen(  # noqa: S603
+        [sys.executable, "-m", __name__, str(output.absolute()), options_file.name],
+        stdin=DEVNULL,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        # so that it keeps running if pytest's process group gets killed (eg. by ctrl+c)
+        start_new_session=True,
+    )
+
+
+def main():
+    output, options_file = map(Path, sys.argv[1:])
+    options = _deserialize_options(options_file.read_text(encoding="utf8"))
+    options_file.unlink()
+    errors_file = background_rebot_errors_file(output)
+    with errors_file.open("w", encoding="utf8") as errors:
+        _ = rebot(str(output), **{**options, "stdout": StringIO(), "stderr": errors})
+    if errors_file.stat().st_size:
+        sys.exit(1)
+    errors_file.unlink()
+
+
+if __name__ == "__main__":
+    main()
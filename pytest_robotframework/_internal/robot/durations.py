@@ -0,0 +1,164 @@
+"""getting how long each test took and whether it passed from robot's output, so that the tests can
+be scheduled, ordered or skipped based on the previous run"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET  # noqa: S405
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from pytest_robotframework._internal.robot.utils import robot_6
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+def _elapsed_seconds(status: ET.Element) -> float | None:
+    if robot_6:
+        # this function is deprecated in robot 7, which has the elapsed time in the output instead
+        from robot.utils import timestamp_to_secs  # noqa: PLC0415
+
+        start, end = status.get("starttime"), status.get("endtime")
+        if not start or not end or "N/A" in {start, end}:
+            return None
+        return timestamp_to_secs(end) - timestamp_to_secs(start)
+    elapsed = status.get("elapsed")
+    return None if elapsed is None else float(elapsed)
+
+
+def nodeid_from_suites(suites: Sequence[tuple[str, str]], name: str, rootdir: Path) -> str | None:
+    """works out the pytest nodeid of a test in a robot output.
+
+    :param suites: the name and source of each suite that the test is in, starting with the top
+    level suite
+    :return: `None` if the test isn't in the `rootdir`
+    """
+    source = suites[-1][1]
+    # suites for classes in python files have the same source as the file, and their names are
+    # part of the nodeid just like for tests
+    file_index = next(index for index, suite in enumerate(suites) if suite[1] == source)
+    try:
+        path = Path(source).relative_to(rootdir).as_posix()
+    except ValueError:
+        return None
+    return "::".join([path, *(suite[0] for suite in suites[file_index + 1 :]), name])
+
+
+def _test_elements(
+    output: Path, rootdir: Path
+) -> Iterator[tuple[str, Sequence[tuple[str, str]], ET.Element]]:
+    """reads the tests from the output one at a time.
+
+    yields:
+        the pytest nodeid of each test, the name and source of each suite that it's in (starting
+        with the top level suite), and its `test` element. the element gets cleared once the next
+        one is read
+    """
+    # the name and source of each suite that the current element is in
+    suites: list[tuple[str, str]] = []
+    # the output was written by robot so it isn't untrusted
+    for event, element in ET.iterparse(output, events=("start", "end")):  # noqa: S314
+        if element.tag == "suite":
+            if event == "start":
+                suites.append((element.get("name", ""), element.get("source", "")))
+            else:
+                _ = suites.pop()
+                element.clear()
+            continue
+        if event != "end" or element.tag != "test" or not suites:
+            continue
+        name = element.get("name")
+        nodeid = None if name is None else nodeid_from_suites(suites, name, rootdir)
+        if nodeid is not None:
+            yield nodeid, tuple(suites), element
+        # don't need the keywords anymore, and they can take up a lot of memory
+        element.clear()
+
+
+def _test_statuses(output: Path, rootdir: Path) -> Iterator[tuple[str, ET.Element]]:
+    """reads the status of each test from the output.
+
+    yields:
+        the pytest nodeid and `status` element of each test
+    """
+    for nodeid, _, element in _test_elements(output, rootdir):
+        status = element.find("status")
+        if status is not None:
+            yield nodeid, status
+
+
+def durations_from_output(output: Path, rootdir: Path) -> dict[str, float]:
+    """reads the duration of each test from a robot output file.
+
+    :return: the durations in seconds, keyed by the pytest nodeid of each test. returns an empty
+    `dict` if the file doesn't exist or can't be read, since it's normal for there to be no output
+    from a previous run
+    """
+    try:
+        return {
+            nodeid: elapsed
+            for nodeid, status in _test_statuses(output, rootdir)
+            if (elapsed := _elapsed_seconds(status)) is not None
+        }
+    except (OSError, ET.ParseError):
+        return {}
+
+
+def failures_from_output(output: Path, rootdir: Path) -> set[str]:
+    """reads which tests failed from a robot output file.
+
+    :return: the pytest nodeids of the failed tests. returns an empty `set` if the file doesn't
+    exist or can't be read
+    """
+    try:
+        return {
+            nodeid
+            for nodeid, status in _test_statuses(output, rootdir)
+            if status.get("status") == "FAIL"
+        }
+    except (OSError, ET.ParseError):
+        return set()
+
+
+class PassedTest(TypedDict):
+    suites: list[tuple[str, str]]
+    """the name and source of each suite that the test is in, starting with the top level suite"""
+    libraries: list[str]
+    """the names of the libraries (or resource files) that the keywords it ran came from"""
+    result: str
+    """the test's element from the output"""
+
+
+def passed_tests_from_output(output: Path, rootdir: Path) -> dict[str, PassedTest]:
+    """reads the results of the tests that passed from a robot output file.
+
+    :return: the results keyed by the pytest nodeid of each passed test. returns an empty `dict` if
+    the file doesn't exist or can't be read
+    """
+    # robot 6 calls it the library instead of the owner
+    owner_attribute = "library" if robot_6 else "owner"
+    try:
+        return {
+            nodeid: {
+                "suites": list(suites),
+                "libraries": sorted({
+                    owner
+                    for keyword in element.iter("kw")
+                    if (owner := keyword.get(owner_attribute)) is not None
+                }),
+                "result": ET.tostring(element, encoding="unicode"),
+            }
+            for nodeid, suites, element in _test_elements(output, rootdir)
+            if (status := element.find("status")) is not None and status.get("status") == "PASS"
+        }
+    except (OSError, ET.ParseError):
+        return {}
+
+
+def output_attributes(output: Path) -> dict[str, str]:
+    """the attributes of the root element of a robot output file (eg. the version of robot that
+    wrote it), without reading the rest of the file"""
+    # the output was written by robot so it isn't untrusted
+    for _, element in ET.iterparse(output, events=("start",)):  # noqa: S314
+        return dict(element.attrib)
+    return {}
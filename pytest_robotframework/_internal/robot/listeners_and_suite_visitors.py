@@ -3,21 +3,19 @@ robot (some of them are not activated when running pytest in `--collect-only` mo
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import suppress
 from functools import wraps
-from inspect import getdoc
-from re import sub
+from inspect import getdoc, isfunction
 from types import MethodType
 from typing import TYPE_CHECKING, Callable, Final, Literal, Optional, TypeVar, cast
 
 from _pytest import runner
 from _pytest.python import PyobjMixin
-from ansi2html import Ansi2HTMLConverter
 from basedtyping import FunctionType as Function, P, T
 from pluggy import HookCaller, HookImpl
 from pluggy._hooks import _SubsetHookCaller  # pyright:ignore[reportPrivateUsage]
-from pytest import Class, Function as PytestFunction, Item, Module, Session, StashKey
+from pytest import Function as PytestFunction, Item, Module, Session, StashKey
 from robot import model, result, running
 from robot.api.interfaces import ListenerV3, Parser
 from robot.errors import HandlerExecutionFailed
@@ -28,6 +26,7 @@ from robot.utils.error import ErrorDetails
 from typing_extensions import Concatenate, override
 
 from pytest_robotframework import (
+    _catch_errors_in,  # pyright:ignore[reportPrivateUsage]
     _get_status_reporter_failures,  # pyright:ignore[reportPrivateUsage]
     _keyword_original_function_attr,  # pyright:ignore[reportPrivateUsage]
     catch_errors,
@@ -40,6 +39,13 @@ from pytest_robotframework._internal.pytest.robot_file_support import (
     original_setup_key,
     original_teardown_key,
 )
+from pytest_robotframework._internal.robot.ansi import (
+    AnsiConverter,
+    defer_escape_codes,
+    deferred_esc,
+    esc,
+    escape_codes,
+)
 from pytest_robotframework._internal.robot.library import (
     __name__ as robot_library_name,
     run_test,
@@ -48,16 +54,19 @@ from pytest_robotframework._internal.robot.library import (
 )
 from pytest_robotframework._internal.robot.utils import (
     Cloaked,
+    ModelTestCase,
     ModelTestSuite,
     add_robot_error,
     full_test_name,
     get_item_from_robot_test,
     robot_6,
     running_test_case_key,
+    set_robot_test,
 )
 from pytest_robotframework._internal.utils import patch_method
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
     from types import ModuleType
 
@@ -89,8 +98,17 @@ class PythonParser(Parser):
     _robot_suite_key: Final = StashKey[running.TestSuite]()
 
     def __init__(self, items: list[Item]) -> None:
-        self.items = items
         super().__init__()
+        self.items_by_source: dict[Path, list[PytestFunction]] = {}
+        """`parse` gets called once for every python file, so we group the items by their source
+        file up front instead of searching through all of them for every file"""
+        for item in items:
+            if not isinstance(item, PytestFunction):
+                continue
+            # save the resolved paths for performance reasons
+            if not item.path.is_absolute():
+                item.path = item.path.resolve()
+            self.items_by_source.setdefault(item.path, []).append(item)
 
     extension = "py"
 
@@ -100,7 +118,6 @@ class PythonParser(Parser):
 
     @override
     def parse(self, source: Path, defaults: TestDefaults) -> running.TestSuite:
-        # save the resolved paths for performance reasons
         if not source.is_absolute():
             source = source.resolve()
 
@@ -110,13 +127,7 @@ class PythonParser(Parser):
         # ourselves
         stacks: list[list[Node]] = []
         current_module: ModuleType | None = None
-        for item in self.items:
-            if not isinstance(item, PytestFunction):
-                continue
-            if not item.path.is_absolute():
-                item.path = item.path.resolve()
-            if item.path != source:
-                continue
+        for item in self.items_by_source.get(source, []):
             item_stack: list[Node] = []
             stacks.append(item_stack)
             found_current_module = False
@@ -136,6 +147,7 @@ class PythonParser(Parser):
         if current_module:
             suite.doc = getdoc(current_module) or ""
 
+        stashed_nodes: list[Node] = []
         for stack in stacks:
             for index, child in enumerate(stack):
                 # the last thing added to the stack should always be a test item
@@ -163,7 +175,7 @@ class PythonParser(Parser):
                         ],
                         parent=parent_suite,
                     )
-                    child.stash[running_test_case_key] = test_case
+                    set_robot_test(child, test_case)
                     _ = parent_suite.tests.append(test_case)
                 else:
                     robot_suite = child.stash.get(self._robot_suite_key, None)
@@ -172,15 +184,14 @@ class PythonParser(Parser):
                             child.name, source=source, parent=parent_suite, doc=documentation
                         )
                         child.stash[self._robot_suite_key] = robot_suite
+                        stashed_nodes.append(child)
                         _ = parent_suite.suites.append(robot_suite)
 
         # need to delete the stashed robot suites now, because otherwise if the same worker gets
         # reused for another test in the same module, the stashed values from the previous test will
         # still be present, which screws it up
-        for item in self.items:
-            for node in item.listchain():
-                if isinstance(node, Class) and self._robot_suite_key in node.stash:
-                    del node.stash[self._robot_suite_key]
+        for node in stashed_nodes:
+            del node.stash[self._robot_suite_key]
 
         return suite
 
@@ -211,12 +222,17 @@ class RobotSuiteCollector(SuiteVisitor):
         if not isinstance(suite, running.TestSuite):
             raise _NotRunningTestSuiteError
         if not suite.parent:  # only do this once, on the top level suite
-            self.session.stash[collected_robot_tests_key] = list(suite.all_tests)  # pyright:ignore[reportUnknownMemberType,reportUnknownArgumentType]
-        suite.tests.clear()
+            collected_tests = self.session.stash[collected_robot_tests_key]
+            for test in cast(Iterator[ModelTestCase], suite.all_tests):
+                if test.source:
+                    collected_tests.setdefault(test.source, []).append(test)
+        # the tests and suites are replaced instead of cleared so that the original lists are left
+        # intact, since they may get reused when running the tests (see `ParsedRobotSuites`)
+        suite.tests = []
 
     @override
     def end_suite(self, suite: ModelTestSuite):
-        suite.suites.clear()
+        suite.suites = []
 
 
 @catch_errors
@@ -233,19 +249,23 @@ class RobotTestFilterer(SuiteVisitor):
     def __init__(self, session: Session, *, items: list[Item]):
         super().__init__()
         self.session = session
-        self.items = items
+        self.items_by_test_name: dict[str, list[RobotItem]] = {}
+        """the items are looked up by name for each robot test, so we index them up front instead of
+        searching through all of them every time"""
+        for item in items:
+            if isinstance(item, RobotItem):
+                self.items_by_test_name.setdefault(
+                    full_test_name(item.collected_robot_test), []
+                ).append(item)
 
     @override
     # https://github.com/robotframework/robotframework/issues/4940
     def visit_test(  # pyright:ignore[reportIncompatibleMethodOverride]
         self, test: running.TestCase
     ):
-        for item in self.items:
-            if isinstance(item, RobotItem) and full_test_name(test) == full_test_name(
-                item.collected_robot_test
-            ):
-                # associate .robot test with its pytest item
-                item.stash[running_test_case_key] = test
+        for item in self.items_by_test_name.get(full_test_name(test), []):
+            # associate .robot test with its pytest item
+            set_robot_test(item, test)
 
     @override
     def end_suite(self, suite: ModelTestSuite):
@@ -254,14 +274,49 @@ class RobotTestFilterer(SuiteVisitor):
 
         # remove any .robot tests that were filtered out by pytest. we do this in end_suite because
         # that's when all the running_test_case_keys should be populated:
-        for test in suite.tests[:]:
-            if not get_item_from_robot_test(self.session, test, all_items_should_have_tests=False):
-                suite.tests.remove(test)
+        suite.tests = [test for test in suite.tests if get_item_from_robot_test(self.session, test)]
 
         # delete any suites that are now empty:
         suite.suites = [s for s in suite.suites if s.test_count > 0]
 
 
+@catch_errors
+class RobotTestOrderer(SuiteVisitor):
+    """sorts the tests and suites to match the order of the pytest items, which robot would
+    otherwise ignore. must run after `RobotTestFilterer` so that every test has an item.
+
+    robot can only reorder the tests within each suite, so the items need to already be grouped by
+    suite (see `_internal.pytest.plugin._group_items_by_suite`)"""
+
+    def __init__(self, session: Session, *, items: list[Item]):
+        super().__init__()
+        self.session = session
+        self.item_indexes = {item: index for index, item in enumerate(items)}
+        self.suite_indexes: dict[int, int] = {}
+        """the index of the first item in each suite, keyed by the `id` of the suite"""
+
+    def _test_index(self, test: ModelTestCase) -> int:
+        item = get_item_from_robot_test(self.session, test)
+        if item is None:
+            raise InternalError(f"no item for {test.name}, it should've been filtered out")
+        return self.item_indexes[item]
+
+    @override
+    def end_suite(self, suite: ModelTestSuite):
+        if not isinstance(suite, running.TestSuite):
+            raise _NotRunningTestSuiteError
+        # the child suites have already been visited so their indexes are known
+        suite.suites = sorted(suite.suites, key=lambda child: self.suite_indexes[id(child)])
+        suite.tests = sorted(suite.tests, key=self._test_index)
+        self.suite_indexes[id(suite)] = min(
+            [
+                *(self.suite_indexes[id(child)] for child in suite.suites),
+                *(self._test_index(test) for test in suite.tests),
+            ],
+            default=len(self.item_indexes),
+        )
+
+
 @catch_errors
 class PytestRuntestProtocolInjector(SuiteVisitor):
     """injects the setup, call and teardown hooks from `_pytest.runner.pytest_runtest_protocol` into
@@ -545,11 +600,15 @@ class ErrorDetector(ListenerV3):
 
 @catch_errors
 class AnsiLogger(ListenerV3):
-    esc = "\N{ESCAPE}"
+    """converts the ansi escape codes in log messages to html. if `defer_conversion` is `True`, the
+    messages are left as they are and get converted when the log is generated instead (see
+    `DeferredAnsiConverter`)"""
 
-    def __init__(self):
+    def __init__(self, *, defer_conversion: bool = False):
         super().__init__()
         self.current_test_status_contains_ansi = False
+        self.defer_conversion = defer_conversion
+        self.converter = AnsiConverter()
 
     @override
     def start_test(self, data: running.TestCase, result: result.TestCase):  # pylint:disable=redefined-outer-name
@@ -557,16 +616,77 @@ class AnsiLogger(ListenerV3):
 
     @override
     def log_message(self, message: Message):
-        if self.esc in message.message and not message.html:
+        if message.html:
+            return
+        if esc in message.message:
             self.current_test_status_contains_ansi = True
-            message.html = True
-            message.message = Ansi2HTMLConverter(inline=True).convert(message.message, full=False)
+            if self.defer_conversion:
+                message.message = defer_escape_codes(message.message)
+            else:
+                message.html = True
+                message.message = self.converter.convert(message.message)
+        elif self.defer_conversion and deferred_esc in message.message:
+            # so that it doesn't get mistaken for an escape character when the log is generated
+            message.message = defer_escape_codes(message.message)
 
     @override
     def end_test(self, data: running.TestCase, result: result.TestCase):  # pylint:disable=redefined-outer-name
         if self.current_test_status_contains_ansi:
             self.current_test_status_contains_ansi = False
-            result.message = sub(rf"{self.esc}\[.*?m", "", result.message)
+            result.message = escape_codes.sub("", result.message)
+
+
+_listener_methods = [
+    name
+    for name, method in vars(ListenerV3).items()
+    if isfunction(method) and not name.startswith("_")
+]
+
+
+class ListenerDispatcher(ListenerV3):
+    """combines the plugin's own listeners into a single one, so that robot only has to call one
+    listener for every message and keyword instead of all of them. each event only gets passed on
+    to the listeners that handle it.
+
+    like when the listeners are registered separately, an error in one of them doesn't stop the
+    event from getting passed on to the others"""
+
+    def __init__(self, listeners: Iterable[ListenerV3]):
+        super().__init__()
+        listeners = list(listeners)
+        for name in _listener_methods:
+            handlers = [
+                # the listeners are decorated with `catch_errors`, but its wrapper gets replaced
+                # with one that uses the name of the listener instead of the dispatcher
+                _catch_errors_in(
+                    MethodType(getattr(method, "__wrapped__", method), listener),
+                    type(listener).__name__,
+                )
+                for listener in listeners
+                # methods that weren't overridden don't do anything
+                if (method := cast(Function, getattr(type(listener), name)))
+                is not getattr(ListenerV3, name)
+            ]
+            if not handlers:
+                continue
+            if len(handlers) == 1:
+                dispatch = handlers[0]
+            else:
+
+                def dispatch(*args: object, handlers: list[Callable[..., object]] = handlers):
+                    error: Exception | None = None
+                    for handler in handlers:
+                        try:
+                            _ = handler(*args)
+                        except Exception as e:  # noqa: BLE001, PERF203
+                            # the error was already recorded by `catch_errors`, so it just needs to
+                            # get raised to robot once the rest of the listeners have been called
+                            error = error or e
+                    if error:
+                        raise error
+
+            # set on the instance so that robot only calls the events that have handlers
+            setattr(self, name, dispatch)
 
 
 def _hide_already_raised_exception_from_robot_log(keyword: Callable[P, T]) -> Callable[P, T]:
@@ -0,0 +1,180 @@
+"""merging robot outputs one suite at a time so that the results from the whole run never need to be
+loaded into memory at once"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET  # noqa: S405
+from typing import TYPE_CHECKING, cast
+
+from robot.reporting.outputwriter import OutputWriter
+from robot.result import Result
+from robot.result.resultbuilder import ExecutionResult  # pyright:ignore[reportUnknownVariableType]
+from typing_extensions import override
+
+from pytest_robotframework._internal.errors import InternalError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+    from robot import result
+
+_SuitePath = tuple[str, ...]
+"""the names of a suite and all of its parents except the top level suite, which has a different
+name in each output"""
+
+_suite_skeleton_elements = frozenset({"suite", "test", "doc", "meta", "metadata", "status"})
+"""the elements in a suite that are kept in the skeleton. everything else is setup/teardown
+keywords"""
+
+_test_skeleton_elements = frozenset({"doc", "tag", "tags", "timeout", "status"})
+"""the elements in a test that are kept in the skeleton. everything else is the test's body"""
+
+
+def _suite_path(suite: result.TestSuite) -> _SuitePath:
+    names: list[str] = []
+    while suite.parent is not None:
+        names.append(suite.name)
+        suite = suite.parent
+    return tuple(reversed(names))
+
+
+class StreamingOutputMerger:
+    """merges robot outputs without loading them all into memory.
+
+    each output gets read one element at a time. the suites that contain tests get written to a
+    temporary file as they're read, and only a "skeleton" of them (the suites and tests without any
+    of their keywords) is kept in memory. the skeletons from all the outputs get merged like rebot
+    normally would, then when writing the merged output, each suite's keywords get loaded back from
+    the temporary files one suite at a time. this means the most that's ever in memory at once is
+    the skeleton and the biggest suite"""
+
+    def __init__(self, temp_dir: Path, merging: Callable[[], AbstractContextManager[None]]):
+        """
+        :param temp_dir: where to write the suites that get split out of the outputs
+        :param merging: gets entered every time suites from multiple outputs get merged, so that
+        they can be merged the same way as the outputs from xdist normally would be
+        """
+        super().__init__()
+        self._temp_dir = temp_dir
+        self._merging = merging
+        self._skeletons: list[str] = []
+        self._fragments: dict[_SuitePath, list[tuple[Path, int, int]]] = {}
+        """the location of every copy of each suite in the temp files, as the file, offset and
+        length in bytes. the same suite can be in multiple outputs if its tests ran on different
+        xdist workers"""
+
+    def add_output(self, output: Path):
+        self._temp_dir.mkdir(parents=True, exist_ok=True)
+        fragments_file = self._temp_dir / f"{len(self._skeletons)}.xml"
+        root: ET.Element | None = None
+        parents: list[ET.Element] = []
+        with fragments_file.open("wb") as file:
+            # the outputs were written by robot during this session so they aren't untrusted
+            for event, element in ET.iterparse(output, events=("start", "end")):  # noqa: S314
+                if event == "start":
+                    if root is None:
+                        root = element
+                    if element.tag == "suite":
+                        parents.append(element)
+                    continue
+                if element.tag != "suite":
+                    continue
+                _ = parents.pop()
+                # only suites that directly contain tests get split out. a suite that contains
+                # other suites is just a directory, so it's small enough to keep in the skeleton
+                if element.find("test") is None or element.find("suite") is not None:
+                    continue
+                if root is None:
+                    raise InternalError(f"found a suite before the root element in {output}")
+                path = (
+                    (*(parent.get("name", "") for parent in parents[1:]), element.get("name", ""))
+                    if parents
+                    else ()
+                )
+                element.tail = None
+                # the suite gets wrapped in its own `<robot>` element so it can be loaded as a
+                # separate output
+                wrapper = ET.Element(root.tag, root.attrib)
+                wrapper.append(element)
+                fragment = ET.tostring(wrapper, encoding="unicode").encode()
+                wrapper.remove(element)
+                self._fragments.setdefault(path, []).append((
+                    fragments_file,
+                    file.tell(),
+                    len(fragment),
+                ))
+                _ = file.write(fragment)
+                _strip_suite(element)
+        if root is None:
+            raise InternalError(f"{output} was empty")
+        self._skeletons.append(ET.tostring(root, encoding="unicode"))
+
+    def load_suite(self, suite: result.TestSuite) -> result.TestSuite | None:
+        """loads the full version of a suite from the skeleton, merged from all the outputs that it
+        was in. returns `None` if the suite is a directory that was never split out of the
+        skeleton"""
+        fragments = self._fragments.get(_suite_path(suite))
+        if not fragments:
+            return None
+        sources: list[str] = []
+        for path, offset, length in fragments:
+            with path.open("rb") as file:
+                _ = file.seek(offset)
+                sources.append(file.read(length).decode())
+        with self._merging():
+            return cast(Result, ExecutionResult(*sources, merge=True)).suite
+
+    def write(self, output: Path, stat_config: dict[str, object] | None = None):
+        with self._merging():
+            skeleton = cast(Result, ExecutionResult(*self._skeletons, merge=True))
+        skeleton.configure(stat_config=stat_config)
+        skeleton.visit(_StreamingOutputWriter(output, rpa=bool(skeleton.rpa), merger=self))
+
+
+def _strip_suite(suite: ET.Element):
+    for child in list(suite):
+        if child.tag not in _suite_skeleton_elements:
+            suite.remove(child)
+        elif child.tag == "test":
+            for test_child in list(child):
+                if test_child.tag not in _test_skeleton_elements:
+                    child.remove(test_child)
+
+
+class _StreamingOutputWriter(OutputWriter):
+    """writes the skeleton, but fills in each suite with the tests and setup/teardown from the full
+    version of it from the `StreamingOutputMerger` while it's being written"""
+
+    def __init__(self, output: Path, *, rpa: bool, merger: StreamingOutputMerger):
+        super().__init__(str(output), rpa=rpa)
+        self._merger = merger
+
+    @override
+    def visit_suite(self, suite: result.TestSuite):
+        full_suite = self._merger.load_suite(suite)
+        if full_suite is None:
+            super().visit_suite(suite)
+            return
+        # the suite can't just be replaced with the full version, because it's only split out of
+        # the outputs where it has no child suites. eg. a python module's tests can run on one
+        # worker while its test classes run on another, in which case the full version only has
+        # the module's tests and the classes are only in the skeleton
+        full_tests = {test.name: test for test in full_suite.tests}
+        skeleton_tests = list(suite.tests)
+        has_setup, has_teardown = suite.has_setup, suite.has_teardown
+        suite.tests = [full_tests.get(test.name, test) for test in skeleton_tests]
+        if not has_setup:
+            suite.setup = full_suite.setup
+        if not has_teardown:
+            suite.teardown = full_suite.teardown
+        try:
+            super().visit_suite(suite)
+        finally:
+            # put the skeleton back so that the full suite doesn't stay in memory
+            suite.tests = skeleton_tests
+            if not has_setup:
+                suite.setup = None
+            if not has_teardown:
+                suite.teardown = None
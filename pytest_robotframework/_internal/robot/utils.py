@@ -170,25 +170,28 @@ def execution_context() -> _ExecutionContext | None:
 
 
 running_test_case_key = StashKey[running.TestCase]()
+"""the `running.TestCase` for an item. don't set this directly, use `set_robot_test` instead so that
+the item can also be looked up from its test using `get_item_from_robot_test`"""
 
+_items_by_robot_test_key = StashKey[dict[running.TestCase, Item]]()
+
+
+def set_robot_test(item: Item, test: running.TestCase):
+    """associates a pytest item with the robot test that will run it, in both directions"""
+    items_by_robot_test = item.session.stash.setdefault(_items_by_robot_test_key, {})
+    previous_test = item.stash.get(running_test_case_key, None)
+    # if the item was already associated with a test from a previous robot run (eg. when running
+    # with xdist), remove it so that the index doesn't keep growing
+    if previous_test is not None and items_by_robot_test.get(previous_test) is item:
+        del items_by_robot_test[previous_test]
+    item.stash[running_test_case_key] = test
+    items_by_robot_test[test] = item
 
-def get_item_from_robot_test(
-    session: Session, test: running.TestCase, *, all_items_should_have_tests: bool = True
-) -> Item | None:
-    """set `all_items_should_have_tests` to `False` if the assigning of the `running_test_case_key`
-    stashes is still in progress
-    """
-    for item in session.items:
-        found_test = (
-            item.stash[running_test_case_key]
-            if all_items_should_have_tests
-            else item.stash.get(running_test_case_key, None)
-        )
-        if found_test == test:
-            return item
-    # the robot test was found but got filtered out by pytest, or if
-    # all_items_should_have_tests=False then it was in a different worker
-    return None
+
+def get_item_from_robot_test(session: Session, test: running.TestCase) -> Item | None:
+    """returns `None` if the robot test was found but got filtered out by pytest, or it was in a
+    different xdist worker"""
+    return session.stash.get(_items_by_robot_test_key, {}).get(test)
 
 
 def full_test_name(test: ModelTestCase) -> str:
@@ -224,6 +227,88 @@ def escape_robot_str(value: str) -> str:
     return value.replace("\\", "\\\\")
 
 
+def _quote_char(value: str | bytes | bytearray) -> str:
+    """the quote character `repr` uses for a `str` or `bytes` value"""
+    if isinstance(value, str):
+        return '"' if "'" in value and '"' not in value else "'"
+    return '"' if b"'" in value and b'"' not in value else "'"
+
+
+def _repr_prefix(value: object, length: int, seen: set[int]) -> str:
+    """`repr(value)`, or a prefix of it that's at least `length` characters long. builtin types are
+    only converted as far as they need to be instead of the whole thing"""
+    if length <= 0:
+        return ""
+    value_type = type(value)
+    if value_type in {str, bytes, bytearray}:
+        value = cast(Union[str, bytes, bytearray], value)
+        prefix = value[:length]
+        # repr picks the quotes depending on what's in the string, so the prefix can only be used if
+        # it would pick the same ones
+        if len(prefix) == len(value) or _quote_char(prefix) != _quote_char(value):
+            return repr(value)
+        return repr(prefix)
+    if value_type in {list, tuple, set, dict} and value:
+        value = cast(
+            Union[list[object], tuple[object, ...], set[object], dict[object, object]], value
+        )
+        if id(value) in seen:
+            # a container that contains itself
+            return (
+                "(...)"
+                if isinstance(value, tuple)
+                else "[...]"
+                if isinstance(value, list)
+                else "{...}"
+            )
+        seen.add(id(value))
+        try:
+            return _container_repr_prefix(value, length, seen)
+        finally:
+            seen.remove(id(value))
+    return repr(value)
+
+
+def _container_repr_prefix(
+    value: list[object] | tuple[object, ...] | set[object] | dict[object, object],
+    length: int,
+    seen: set[int],
+) -> str:
+    result = "(" if isinstance(value, tuple) else "[" if isinstance(value, list) else "{"
+    for index, item in enumerate(value.items() if isinstance(value, dict) else value):
+        if index:
+            result += ", "
+        if isinstance(value, dict):
+            key, item_value = cast(tuple[object, object], item)
+            result += _repr_prefix(key, length - len(result), seen)
+            if len(result) >= length:
+                return result
+            result += ": " + _repr_prefix(item_value, length - len(result) - 2, seen)
+        else:
+            result += _repr_prefix(item, length - len(result), seen)
+        if len(result) >= length:
+            return result
+    if isinstance(value, tuple):
+        return result + (",)" if len(value) == 1 else ")")
+    return result + ("]" if isinstance(value, list) else "}")
+
+
+def truncated_str(value: object, max_length: int) -> str:
+    """`str(value)`, truncated to `max_length` characters with `...` on the end if it was too long.
+
+    for builtin types, only as much of the value as is needed gets converted to a string, so that
+    large values don't get fully converted just for most of it to be thrown away"""
+    value_str = (
+        cast(str, value)[: max_length + 1]
+        if type(value) is str
+        # str is the same as repr for everything else that `_repr_prefix` handles
+        else _repr_prefix(value, max_length + 1, set())
+        if type(value) in {bytes, bytearray, list, tuple, set, dict}
+        else str(value)
+    )
+    return value_str[:max_length] + "..." if len(value_str) > max_length else value_str
+
+
 def _merge_robot_options(
     dict1: InternalRobotOptions, dict2: InternalRobotOptions
 ) -> dict[str, object]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from abc import abstractmethod
 from contextlib import AbstractContextManager
 from functools import wraps
@@ -68,5 +69,19 @@ class SuppressableContextManager(AbstractContextManager[out_T], Protocol[out_T])
     ) -> bool: ...
 
 
+def _qualified_name(value: object) -> str:
+    # classes and functions are identified by their own name, anything else by its class
+    named = cast(type, value if hasattr(value, "__qualname__") else type(value))
+    return f"{named.__module__}.{named.__qualname__}"
+
+
+def cache_key(value: object) -> str:
+    """serializes `value` (eg. the robot options) as json to compare against the one stored in
+    pytest's cache. objects that json can't serialize (eg. a `prerunmodifier` that's an object
+    instead of a string) are serialized as their qualified name instead of their repr, since that
+    usually contains their memory address which would make the key different on every run"""
+    return json.dumps(value, default=_qualified_name, sort_keys=True)
+
+
 main_package_name = __name__.split(".")[0]
 """the name of the top level package (should be `pytest_robotframework`)"""
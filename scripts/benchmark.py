@@ -0,0 +1,82 @@
+"""generates a project with lots of trivial tests and times how long pytest takes to run them with
+the plugin. this is useful for catching changes that make the plugin's overhead grow faster than
+the number of tests.
+
+example:
+-------
+```
+./pw benchmark --robot-tests 6000 --repeat 3
+```
+"""
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from subprocess import run  # noqa: S404
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+def _write_robot_files(directory: Path, *, files: int, tests: int):
+    for file_index in range(files):
+        lines = ["*** Test Cases ***"]
+        for test_index in range(tests // files):
+            lines += [f"Test {test_index}", "    No Operation"]
+        _ = (directory / f"suite_{file_index}.robot").write_text("\n".join(lines) + "\n")
+
+
+def _write_python_files(directory: Path, *, files: int, tests: int):
+    for file_index in range(files):
+        _ = (directory / f"test_module_{file_index}.py").write_text(
+            "".join(
+                f"def test_{test_index}():\n    pass\n\n" for test_index in range(tests // files)
+            )
+        )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    _ = parser.add_argument("--robot-tests", type=int, default=0)
+    _ = parser.add_argument("--python-tests", type=int, default=0)
+    _ = parser.add_argument(
+        "--files", type=int, default=10, help="how many files to spread the tests across"
+    )
+    _ = parser.add_argument("--repeat", type=int, default=1)
+    args, pytest_args = parser.parse_known_args()
+    robot_tests: int = args.robot_tests
+    python_tests: int = args.python_tests
+    files: int = args.files
+    repeat: int = args.repeat
+    if not robot_tests and not python_tests:
+        robot_tests = python_tests = 1000
+
+    with TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        if robot_tests:
+            _write_robot_files(directory, files=files, tests=robot_tests)
+        if python_tests:
+            _write_python_files(directory, files=files, tests=python_tests)
+        durations: list[float] = []
+        for _ in range(repeat):
+            start = perf_counter()
+            result = run(  # noqa: S603
+                [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *pytest_args],
+                cwd=directory,
+                capture_output=True,
+                check=False,
+            )
+            durations.append(perf_counter() - start)
+            if result.returncode:
+                _ = sys.stdout.buffer.write(result.stdout)
+                raise Exception(f"pytest failed with exit code {result.returncode}")
+    print(  # noqa: T201
+        f"{robot_tests} robot tests, {python_tests} python tests in {files} files each: "
+        + ", ".join(f"{duration:.2f}s" for duration in durations)
+        + f" (best: {min(durations):.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_asdf():
+    logger.info("".join(f"\N{ESCAPE}[31mline {index}\N{ESCAPE}[0m\n" for index in range(20_000)))
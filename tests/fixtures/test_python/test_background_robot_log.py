@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+
+def test_one_test_robot():
+    pass
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_asdf():
+    logger.info("\N{ESCAPE}[31masdf\N{ESCAPE}[0m")
+    # not an escape code, so it shouldn't get converted
+    logger.info("\N{SYMBOL FOR ESCAPE}[31mfdsa")
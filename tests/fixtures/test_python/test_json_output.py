@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+
+def test_foo(): ...
+def test_bar(): ...
+def test_fail():
+    raise Exception("asdf")
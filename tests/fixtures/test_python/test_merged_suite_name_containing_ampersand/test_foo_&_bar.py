@@ -0,0 +1,6 @@
+# noqa: N999
+from __future__ import annotations
+
+
+def test_foo_and_bar():
+    pass
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+def test_one():
+    pass
+
+
+def test_fail():
+    raise Exception("asdf")
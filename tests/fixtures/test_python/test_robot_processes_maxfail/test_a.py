@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+def test_fail():
+    raise Exception
+
+
+def test_one():
+    pass
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from time import sleep
+
+
+def test_slow():
+    # gives the other process time to fail
+    sleep(3)
+
+
+def test_two():
+    pass
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+
+def test_three():
+    raise Exception("asdf")
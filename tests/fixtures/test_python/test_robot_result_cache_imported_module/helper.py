@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+
+def value() -> int:
+    return 1
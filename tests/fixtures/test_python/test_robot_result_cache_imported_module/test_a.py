@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from . import helper
+
+
+def test_value():
+    assert helper.value() == 1
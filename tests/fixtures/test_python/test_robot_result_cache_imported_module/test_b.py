@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+# helper was already imported by the time this file gets imported
+from .helper import value
+
+
+def test_value():
+    assert value() == 1
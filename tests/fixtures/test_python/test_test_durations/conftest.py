@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytest_robotframework import get_test_durations
+
+if TYPE_CHECKING:
+    from pytest import Session
+
+
+def pytest_sessionfinish(session: Session):
+    _ = Path("durations.json").write_text(
+        json.dumps(get_test_durations(session.config)), encoding="utf8"
+    )
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from time import sleep
+
+
+def test_one():
+    sleep(0.1)
+
+
+def test_two():
+    pass
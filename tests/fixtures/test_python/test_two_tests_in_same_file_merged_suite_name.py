@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+def test_foo():
+    pass
+
+
+def test_bar():
+    pass
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+
+from robot.api import logger
+
+
+def test_one():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
+
+
+def test_two():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
+
+
+def test_three():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import os
+from time import sleep
+
+from robot.api import logger
+
+
+def test_one():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
+    sleep(0.4)
+
+
+def test_two():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
+    sleep(0.4)
+
+
+def test_three():
+    logger.info(os.environ["PYTEST_XDIST_WORKER"])
+    sleep(0.4)
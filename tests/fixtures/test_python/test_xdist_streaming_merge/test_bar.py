@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_one():
+    logger.info("bar one")
+
+
+def test_two():
+    logger.info("bar two")
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_a():
+    logger.info("m a")
+
+
+def test_b():
+    logger.info("m b")
+
+
+class TestC:
+    @staticmethod
+    def test_d():
+        logger.info("m c d")
+
+    @staticmethod
+    def test_e():
+        logger.info("m c e")
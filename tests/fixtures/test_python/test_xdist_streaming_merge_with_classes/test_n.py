@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_a():
+    logger.info("n a")
+
+
+def test_b():
+    logger.info("n b")
+
+
+class TestC:
+    @staticmethod
+    def test_d():
+        logger.info("n c d")
+
+    @staticmethod
+    def test_e():
+        logger.info("n c e")
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from robot.api import logger
+
+
+def test_one():
+    logger.info("foo one")
+
+
+def test_two():
+    logger.info("foo two")
+
+
+def test_three():
+    raise Exception("asdf")
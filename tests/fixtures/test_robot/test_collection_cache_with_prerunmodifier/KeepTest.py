@@ -0,0 +1,18 @@
+# noqa: N999
+# in robot if a class has the same name as the file you don't have to specify both
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from robot.api import SuiteVisitor
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from robot import model
+
+
+class KeepTest(SuiteVisitor):
+    @override
+    def start_suite(self, suite: model.TestSuite):
+        suite.tests = [test for test in suite.tests if test.name == os.environ["KEEP"]]
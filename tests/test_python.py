@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import json
 import re
 import sys
 from pathlib import Path
 from re import search
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, cast
 
 from _pytest.assertion.util import running_on_ci
 from pytest import ExitCode, MonkeyPatch, skip
+from robot import rebot
+from robot.api import ExecutionResult
 
+from pytest_robotframework._internal.robot.listeners_and_suite_visitors import RobotSuiteCollector
 from pytest_robotframework._internal.robot.utils import robot_6
 from tests.conftest import (
     PytestRobotTester,
@@ -761,6 +766,61 @@ def test_two_tests_specified_by_full_path_in_different_files(pr: PytestRobotTest
     assert not xml.xpath("//meta")
 
 
+def test_merged_suite_name_containing_ampersand(pr: PytestRobotTester):
+    pr.run_and_assert_result("test_foo.py", "test_foo_&_bar.py", passed=2)
+    pr.assert_log_file_exists()
+    # the name of the suite that contains " & " shouldn't get split up when it's combined
+    assert xpath(
+        output_xml(),
+        "/robot/suite[@name='Test Foo & Test Foo & Bar' or @name='Test Foo & Bar & Test Foo']",
+    )
+
+
+def test_two_tests_in_same_file_merged_suite_name(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=2)
+    pr.run_and_assert_result(passed=2)
+    pr.assert_log_file_exists()
+    # each worker's output has the same top level suite, so its name shouldn't get repeated
+    assert not output_xml().xpath("/robot/suite[contains(@name, '&')]")
+
+
+def test_xdist_merge_messages(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=2)
+    pr.run_and_assert_result(passed=2, failed=1)
+    pr.assert_log_file_exists()
+    xml = output_xml()
+    # rebot shouldn't add a message to each test and suite saying it was merged
+    assert not xml.xpath("//status[contains(., 'merged output')]")
+    assert xpath(xml, "//test[@name='test_fail']/status[.='asdf']")
+
+
+def test_json_output(pr: PytestRobotTester):
+    if robot_6:
+        skip("robot 6 can't write json outputs")
+    pr.run_and_assert_assert_pytest_result("--robot-output", "output.json", passed=2, failed=1)
+    pr.assert_log_file_exists()
+    result = ExecutionResult(pr.pytester.path / "output.json")
+    assert result.statistics.total.passed == 2
+    assert result.statistics.total.failed == 1
+    assert not (pr.pytester.path / "output.xml").exists()
+
+
+def test_background_robot_log(pr: PytestRobotTester):
+    pr.run_and_assert_result("--background-robot-log", passed=1)
+    assert_robot_total_stats(passed=1)
+    # the log and report get generated by a separate process that pytest doesn't wait for. the
+    # report gets written after the log
+    deadline = monotonic() + 60
+    while not (pr.pytester.path / "report.html").exists():
+        assert monotonic() < deadline, "the log wasn't generated in the background"
+        sleep(0.1)
+    pr.assert_log_file_exists()
+    # the errors file gets deleted once rebot finishes without any errors
+    while (pr.pytester.path / "output_rebot_errors.txt").exists():
+        assert monotonic() < deadline, "rebot didn't finish"
+        sleep(0.1)
+
+
 def test_assertion_rewritten_in_conftest_when_assertion_hook_enabled(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, passed=1)
     pr.assert_log_file_exists()
@@ -838,6 +898,51 @@ assert [1, 2, 3] == [1, '<div>asdf</div>', 3]
     ]""")
 
 
+def test_ansi_large_message(pr: PytestRobotTester):
+    pr.run_and_assert_result(passed=1)
+    pr.assert_log_file_exists()
+    message = xpath(output_xml(), "//msg[@level='INFO' and @html='true']").text
+    assert message
+    assert "\N{ESCAPE}" not in message
+    assert message.count('<span style="color: #aa0000">') == 20_000
+    assert '<span style="color: #aa0000">line 19999</span>' in message
+
+
+def test_defer_ansi_conversion(pr: PytestRobotTester):
+    pr.run_and_assert_result("--defer-ansi-conversion", passed=1)
+    pr.assert_log_file_exists()
+    # when running with xdist the messages get converted when the outputs are merged
+    if not pr.xdist:
+        xml = output_xml()
+        assert xpath(
+            xml,
+            "//msg[@level='INFO' and not(@html) and .='\N{SYMBOL FOR ESCAPE}[31masdf"
+            + "\N{SYMBOL FOR ESCAPE}[0m']",
+        )
+        assert xpath(
+            xml,
+            "//msg[@level='INFO' and not(@html) and .='\N{SYMBOL FOR ESCAPE}"
+            + "\N{SYMBOL FOR ESCAPE}[31mfdsa']",
+        )
+        # this is what happens when the log gets generated
+        output = str(pr.pytester.path / "output.xml")
+        _ = rebot(
+            output,
+            output=output,
+            log=None,
+            report=None,
+            # the name documented in the readme
+            prerebotmodifier="pytest_robotframework.DeferredAnsiConverter",
+        )
+    xml = output_xml()
+    assert xpath(
+        xml,
+        "//msg[@level='INFO' and @html='true' and "
+        + """.='<span style="color: #aa0000">asdf</span>']""",
+    )
+    assert xpath(xml, "//msg[@level='INFO' and not(@html) and .='\N{SYMBOL FOR ESCAPE}[31mfdsa']")
+
+
 def test_set_log_level(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
@@ -965,3 +1070,177 @@ def test_maxfail(pr: PytestRobotTester):
             "--maxfail doesn't work with xdist. https://github.com/pytest-dev/pytest-xdist/issues/868"
         )
     pr.run_and_assert_result("--maxfail=2", failed=2, skipped=1)
+
+
+def test_xdist_streaming_merge(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=2)
+    pr.run_and_assert_result("--xdist-streaming-merge", passed=4, failed=1)
+    pr.assert_log_file_exists()
+    assert_robot_total_stats(passed=4, failed=1)
+    xml = output_xml()
+    # each test should only be in the output once, with its keywords and the correct id
+    for suite_name, test_name, message in [
+        ("Test Foo", "test_one", "foo one"),
+        ("Test Foo", "test_two", "foo two"),
+        ("Test Bar", "test_one", "bar one"),
+        ("Test Bar", "test_two", "bar two"),
+    ]:
+        test = xpath(xml, f"//suite[@name='{suite_name}']/test[@name='{test_name}']")
+        assert xpath(test, "./kw/msg").text == message
+        assert test.attrib["id"].startswith(xpath(test, "..").attrib["id"])
+    assert xpath(xml, "//test[@name='test_three']/status[.='asdf']")
+    assert not xml.xpath("//status[contains(., 'merged output')]")
+
+
+def test_xdist_streaming_merge_with_classes(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=3)
+    # loadscope sends the module level tests and the test class from the same file to different
+    # workers, so that each worker's output only has one of them in that file's suite
+    pr.run_and_assert_result("--xdist-streaming-merge", "--dist=loadscope", passed=8)
+    xml = output_xml()
+    assert len(xml.xpath("//test")) == 8
+    for module in ["m", "n"]:
+        for suite_path, test_name, message in [
+            ("", "test_a", "a"),
+            ("", "test_b", "b"),
+            ("/suite[@name='TestC']", "test_d", "c d"),
+            ("/suite[@name='TestC']", "test_e", "c e"),
+        ]:
+            test = xpath(
+                xml, f"//suite[@name='Test {module.upper()}']{suite_path}/test[@name='{test_name}']"
+            )
+            assert xpath(test, "./kw/msg").text == f"{module} {message}"
+
+
+def test_xdist_streaming_merge_without_log(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=2)
+    pr.run_and_assert_result(
+        "--xdist-streaming-merge",
+        "--robot-log",
+        "NONE",
+        "--robot-report",
+        "NONE",
+        passed=4,
+        failed=1,
+    )
+    pr.assert_log_file_doesnt_exist()
+    assert not (pr.pytester.path / "report.html").exists()
+    assert len(output_xml().xpath("//test")) == 5
+
+
+def test_xdist_robot_suite_scheduling(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=2)
+    # run twice so that the second run has the durations from the first one
+    for _ in range(2):
+        pr.run_and_assert_result("--xdist-robot-suite-scheduling", passed=9)
+        pr.assert_log_file_exists()
+    xml = output_xml()
+    for suite_name in ["Test Foo", "Test Bar", "Test Baz"]:
+        workers = set(
+            cast(list[str], xml.xpath(f"//suite[@name='{suite_name}']/test/kw/msg/text()"))
+        )
+        assert len(workers) == 1, f"{suite_name} ran on multiple workers: {workers}"
+    # with only one worker, the suites run in the order that they got scheduled in
+    pr.xdist = 1
+    pr.run_and_assert_result("--xdist-robot-suite-scheduling", passed=9)
+    tests = sorted(
+        ExecutionResult(pr.pytester.path / "output.xml").suite.all_tests,
+        key=lambda test: test.starttime,
+    )
+    assert list(dict.fromkeys(test.parent.name for test in tests)) == [
+        "Test Foo",
+        "Test Bar",
+        "Test Baz",
+    ]
+
+
+def test_robot_processes(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result("--robot-processes", "2", passed=3, failed=1)
+    pr.assert_log_file_exists()
+    assert_robot_total_stats(passed=3, failed=1)
+    # each file should have been run by robot in its own process
+    assert len(list(pr.pytester.path.glob("**/robot_processes/*/output.xml"))) == 2
+    # which only collected the items from that file
+    logs = list(pr.pytester.path.glob("**/robot_processes/*/pytest.log"))
+    assert len(logs) == 2
+    for log in logs:
+        assert "collected 2 items" in log.read_text(encoding="utf8")
+    assert xpath(output_xml(), "//test[@name='test_fail']/status[.='asdf']")
+
+
+def test_robot_processes_maxfail(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result("--robot-processes", "2", "--maxfail=1", passed=1, failed=1, skipped=2)
+    pr.assert_log_file_exists()
+    assert_robot_total_stats(passed=1, failed=1, skipped=2)
+
+
+def test_test_durations(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    for _ in range(2):
+        pr.run_and_assert_result(passed=2)
+    durations = cast(
+        dict[str, dict[str, float]], json.loads((pr.pytester.path / "durations.json").read_text())
+    )
+    assert durations.keys() == {"test_foo.py::test_one", "test_foo.py::test_two"}
+    assert durations["test_foo.py::test_one"]["runs"] == 2
+    assert durations["test_foo.py::test_one"]["average"] >= 0.1
+    assert durations["test_foo.py::test_one"]["last"] >= 0.1
+
+
+def test_robot_failed_first(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result(passed=2, failed=1)
+    assert output_xml().xpath("//test/@name") == ["test_one", "test_two", "test_three"]
+    pr.run_and_assert_result("--robot-failed-first", passed=2, failed=1)
+    assert output_xml().xpath("//test/@name") == ["test_three", "test_one", "test_two"]
+
+
+def test_robot_result_cache(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result("--robot-result-cache", passed=2, failed=1)
+    # the tests in test_a.py passed and haven't changed so only the failed one runs again
+    pr.run_and_assert_assert_pytest_result("--robot-result-cache", failed=1)
+    pr.assert_log_file_exists()
+    assert_robot_total_stats(passed=2, failed=1)
+    assert xpath(output_xml(), "//test[@name='test_one']/status[@status='PASS']")
+    # every test in test_a.py is cached, which shouldn't count as no tests being collected
+    pr.run_and_assert_assert_pytest_result("--robot-result-cache", "test_a.py")
+    assert_robot_total_stats(passed=2)
+    # modifying the file means its tests have to run again
+    test_a = pr.pytester.path / "test_a.py"
+    content = test_a.read_text(encoding="utf8")
+    # it's a symlink to the fixture
+    test_a.unlink()
+    _ = test_a.write_text(content + "\n", encoding="utf8")
+    pr.run_and_assert_result("--robot-result-cache", passed=2, failed=1)
+
+
+def test_robot_result_cache_imported_module(pytester_dir: PytesterDir):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result("--robot-result-cache", passed=2)
+    # the test files didn't change, but the module they import did so their tests have to run again
+    helper = pr.pytester.path / "helper.py"
+    # it's a symlink to the fixture
+    helper.unlink()
+    _ = helper.write_text("def value() -> int:\n    return 2\n", encoding="utf8")
+    pr.run_and_assert_result("--robot-result-cache", failed=2)
+
+
+def test_robot_collection_skipped_without_robot_files(
+    pytester_dir: PytesterDir, monkeypatch: MonkeyPatch
+):
+    def fail(*_: object):
+        raise Exception("robot shouldn't have been run during collection")
+
+    monkeypatch.setattr(RobotSuiteCollector, "__init__", fail)
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result(subprocess=False, passed=1)
+    pr.assert_log_file_exists()
+
+
+def test_no_robot_files(pr: PytestRobotTester):
+    pr.run_and_assert_result("--no-robot-files", passed=1)
+    pr.assert_log_file_exists()
+    assert not output_xml().xpath(".//test[@name='Foo']")
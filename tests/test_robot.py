@@ -3,14 +3,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, cast
 
-from pytest import ExitCode, Item, Mark
+from pytest import ExitCode, Item, Mark, MonkeyPatch
+from robot.running.builder.parsers import RobotParser
 
+from pytest_robotframework._internal.robot.listeners_and_suite_visitors import RobotSuiteCollector
 from pytest_robotframework._internal.robot.utils import robot_6
 from tests.conftest import PytestRobotTester, assert_robot_total_stats, output_xml, xpath
 
 if TYPE_CHECKING:
     from pytest import Session
 
+    from pytest_robotframework._internal.robot.utils import ModelTestSuite
+    from tests.conftest import PytesterDir
+
 
 def test_one_test_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
@@ -336,3 +341,56 @@ def test_keyword_decorator_class_library(pr: PytestRobotTester):
         output_xml(),
         f"//kw[@name='Foo' and @{'library' if robot_6 else 'owner'}='ClassLibrary']/msg[.='hi']",
     )
+
+
+def test_collection_cache(pytester_dir: PytesterDir, monkeypatch: MonkeyPatch):
+    parsed_tests: list[str] = []
+    original_start_suite = RobotSuiteCollector.start_suite
+
+    def start_suite(self: RobotSuiteCollector, suite: ModelTestSuite):
+        if not suite.parent:
+            parsed_tests.extend(test.name for test in suite.all_tests)
+        original_start_suite(self, suite)
+
+    monkeypatch.setattr(RobotSuiteCollector, "start_suite", start_suite)
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    pr.run_and_assert_result(subprocess=False, passed=2)
+    assert sorted(parsed_tests) == ["Bar", "Foo"]
+    parsed_tests.clear()
+    # nothing changed so robot shouldn't need to parse anything
+    pr.run_and_assert_result(subprocess=False, passed=2)
+    assert not parsed_tests
+    bar_file = pr.pytester.path / "bar.robot"
+    # the fixture files are symlinked so it needs to be replaced instead of modified
+    bar_file.unlink()
+    _ = bar_file.write_text("*** Test Cases ***\nBar\n    No Operation\nBaz\n    No Operation\n")
+    # only the modified file should get parsed again
+    pr.run_and_assert_result(subprocess=False, passed=3)
+    assert sorted(parsed_tests) == ["Bar", "Baz"]
+
+
+def test_collection_cache_with_prerunmodifier(pytester_dir: PytesterDir, monkeypatch: MonkeyPatch):
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    # the prerunmodifier changes which tests get collected even though the files are the same
+    for test_name in ["A1", "A2"]:
+        monkeypatch.setenv("KEEP", test_name)
+        pr.run_and_assert_result(
+            "--robot-prerunmodifier", str(pr.pytester.path / "KeepTest.py"), passed=1
+        )
+        assert xpath(output_xml(), f"//test[@name='{test_name}']")
+
+
+def test_parsed_suites_reused(pytester_dir: PytesterDir, monkeypatch: MonkeyPatch):
+    parsed_files: list[str] = []
+    original_get_source = RobotParser._get_source  # pyright:ignore[reportPrivateUsage]
+
+    def get_source(self: RobotParser, source: Path) -> Path | str:
+        parsed_files.append(source.name)
+        return original_get_source(self, source)
+
+    monkeypatch.setattr(RobotParser, "_get_source", get_source)
+    pr = PytestRobotTester(pytester=pytester_dir, xdist=None)
+    # disable the collection cache so that the files get parsed during collection
+    pr.run_and_assert_result("-p", "no:cacheprovider", subprocess=False, passed=2)
+    # each file should only be parsed once, during collection
+    assert sorted(parsed_files) == ["bar.robot", "foo.robot"]
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from pytest_robotframework._internal.robot.utils import merge_robot_options
+from pytest import raises
+from robot import result, running
+from robot.api import SuiteVisitor
+from robot.api.interfaces import ListenerV3
+from typing_extensions import override
+
+from pytest_robotframework._internal.robot.listeners_and_suite_visitors import ListenerDispatcher
+from pytest_robotframework._internal.robot.utils import merge_robot_options, truncated_str
+from pytest_robotframework._internal.utils import cache_key
 
 
 def test_merge_robot_options():
@@ -36,3 +44,54 @@ def test_merge_robot_options_list_3_dicts():
         "a": ["b", "e", "f"],
         "c": "d",
     }
+
+
+def test_truncated_str():
+    assert truncated_str("a" * 50, 50) == "a" * 50
+    assert truncated_str("a" * 51, 50) == "a" * 50 + "..."
+
+
+def test_truncated_str_containers():
+    value = {"a": [b"b" * 100, ("c",)], "d": {1, 2}}
+    assert truncated_str(value, 10) == str(value)[:10] + "..."
+    assert truncated_str(value, 1000) == str(value)
+
+
+def test_truncated_str_quotes():
+    # repr uses different quotes if the string contains a `'`, but that's not in the truncated part
+    value = ["a" * 20 + "'"]
+    assert truncated_str(value, 10) == str(value)[:10] + "..."
+
+
+def test_truncated_str_recursive():
+    value: list[object] = [1]
+    value.append(value)
+    assert truncated_str(value, 50) == "[1, [...]]"
+
+
+def test_listener_dispatcher_error_in_one_listener():
+    calls: list[str] = []
+
+    class Failing(ListenerV3):
+        @override
+        def start_test(self, data: running.TestCase, result: result.TestCase):
+            calls.append("failing")
+            raise Exception("asdf")
+
+    class Passing(ListenerV3):
+        @override
+        def start_test(self, data: running.TestCase, result: result.TestCase):
+            calls.append("passing")
+
+    dispatcher = ListenerDispatcher([Failing(), Passing()])
+    with raises(Exception, match="asdf"):
+        dispatcher.start_test(running.TestCase(), result.TestCase())
+    assert calls == ["failing", "passing"]
+
+
+def test_cache_key_objects():
+    # the key should be the same for different instances, instead of containing their address
+    key = cache_key({"prerunmodifier": [SuiteVisitor()]})
+    assert key == cache_key({"prerunmodifier": [SuiteVisitor()]})
+    assert "robot.model.visitor.SuiteVisitor" in key
+    assert cache_key({"prerunmodifier": [SuiteVisitor]}) == key